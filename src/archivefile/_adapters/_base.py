@@ -27,6 +27,9 @@ class BaseArchiveAdapter(Protocol):
     Refer to `src/archivefile/_core.py` for documentation of every method and property.
     """
 
+    # Empty so that subclasses which declare their own `__slots__` don't get a `__dict__` anyway.
+    __slots__ = ()
+
     # fmt: off
     @overload
     def __init__(self, file: StrPath, mode: OpenArchiveMode = "r", *, password: str | None = None, compression_type: CompressionType | None = None, compression_level: CompressionLevel | None = None, **kwargs: Any) -> None: ...
@@ -102,7 +105,11 @@ class BaseArchiveAdapter(Protocol):
     def extract(self, member: StrPath | ArchiveMember, *, destination: StrPath = Path.cwd()) -> Path: ...
 
     def extractall(
-        self, *, destination: StrPath = Path.cwd(), members: CollectionOf[StrPath | ArchiveMember] | None = None
+        self,
+        *,
+        destination: StrPath = Path.cwd(),
+        members: CollectionOf[StrPath | ArchiveMember] | None = None,
+        workers: int = 1,
     ) -> Path: ...
 
     def read_bytes(self, member: StrPath | ArchiveMember) -> bytes: ...
@@ -143,6 +150,7 @@ class BaseArchiveAdapter(Protocol):
         root: StrPath | None = None,
         glob: str = "*",
         recursive: bool = True,
+        auto_store: bool = True,
     ) -> None: ...
 
     def close(self) -> None: ...
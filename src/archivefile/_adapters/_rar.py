@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, overload
 
 from archivefile._adapters._base import BaseArchiveAdapter
 from archivefile._models import ArchiveMember
-from archivefile._utils import get_member_name, realpath
+from archivefile._utils import abspath, get_member_name, realpath
+from pydantic import ByteSize
 from rarfile import NoRarEntry, RarFile
 
 if TYPE_CHECKING:
@@ -55,6 +57,11 @@ class RarFileAdapter(BaseArchiveAdapter):
         self._file = realpath(file)
         self._mode = mode[0]
         self._password = password
+        # Destinations that extract() and extractall() have already created.
+        # The underlying libraries recreate missing directories anyway, so this is only a shortcut.
+        self._ensured_dirs: set[Path] = set()
+        # Archives opened for reading can't change, so their names only need listing once.
+        self._names: tuple[str, ...] | None = None
 
         if self._mode == "r":
             self._rarfile = RarFile(self._file, mode=self._mode, **kwargs)
@@ -105,31 +112,38 @@ class RarFileAdapter(BaseArchiveAdapter):
         except NoRarEntry:
             raise KeyError(f"{name} not found in {self._file}")
 
-        is_dir = True if rarinfo.filename.endswith("/") else False
-        return ArchiveMember(
+        is_dir = rarinfo.filename.endswith("/")
+        return ArchiveMember.model_construct(
             name=rarinfo.filename,
-            size=rarinfo.file_size,
-            compressed_size=rarinfo.compress_size,
-            datetime=datetime(*rarinfo.date_time),
-            checksum=rarinfo.CRC,
+            size=ByteSize(rarinfo.file_size),
+            compressed_size=ByteSize(rarinfo.compress_size),
+            datetime=datetime(*rarinfo.date_time).astimezone(timezone.utc),
+            checksum=rarinfo.CRC or 0,
             is_dir=is_dir,
             is_file=not is_dir,
         )
 
     def get_members(self) -> Generator[ArchiveMember]:
         for rarinfo in self._rarfile.infolist():
-            yield ArchiveMember(
+            is_dir = rarinfo.filename.endswith("/")
+            yield ArchiveMember.model_construct(
                 name=rarinfo.filename,
-                size=rarinfo.file_size,
-                compressed_size=rarinfo.compress_size,
-                datetime=datetime(*rarinfo.date_time),
-                checksum=rarinfo.CRC,
-                is_dir=True if rarinfo.filename.endswith("/") else False,
-                is_file=False if rarinfo.filename.endswith("/") else True,
+                size=ByteSize(rarinfo.file_size),
+                compressed_size=ByteSize(rarinfo.compress_size),
+                datetime=datetime(*rarinfo.date_time).astimezone(timezone.utc),
+                checksum=rarinfo.CRC or 0,
+                is_dir=is_dir,
+                is_file=not is_dir,
             )
 
     def get_names(self) -> tuple[str, ...]:
-        return tuple(self._rarfile.namelist())
+        if self._names is not None:
+            return self._names
+
+        names = tuple(self._rarfile.namelist())
+        if self._mode[:1] == "r":
+            self._names = names
+        return names
 
     def print_tree(
         self,
@@ -142,7 +156,14 @@ class RarFileAdapter(BaseArchiveAdapter):
         except ModuleNotFoundError:
             raise ModuleNotFoundError("The 'print_tree()' method requires the 'bigtree' dependency.")
 
-        paths = [f"{self.file.name}/{member}" for member in self.get_names()]
+        names = self.get_names()
+
+        if max_depth > 0:
+            # Members nested deeper than `max_depth` are never shown, so don't bother building nodes for them.
+            # The archive itself is the root node and takes up the first level.
+            names = tuple(dict.fromkeys("/".join(name.split("/")[: max_depth - 1]) for name in names))
+
+        paths = [f"{self.file.name}/{member}" for member in names]
         tree = list_to_tree(paths)  # type: ignore
         tree.show(max_depth=max_depth, style=style)
 
@@ -172,7 +193,7 @@ class RarFileAdapter(BaseArchiveAdapter):
         table.add_column("Type", no_wrap=True)
         table.add_column("Size", no_wrap=True)
         table.add_column("Compressed Size", no_wrap=True)
-        for member in sorted(members, key=lambda member: getattr(member, sort_by), reverse=descending):
+        for member in sorted(members, key=attrgetter(sort_by), reverse=descending):
             table.add_row(
                 member.name,
                 member.datetime.isoformat(),
@@ -183,8 +204,10 @@ class RarFileAdapter(BaseArchiveAdapter):
         richprint(table)
 
     def extract(self, member: StrPath | ArchiveMember, *, destination: StrPath = Path.cwd()) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = abspath(destination)
+        if destination not in self._ensured_dirs:
+            destination.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(destination)
 
         name = get_member_name(member)
 
@@ -198,10 +221,16 @@ class RarFileAdapter(BaseArchiveAdapter):
         return destination / name
 
     def extractall(
-        self, *, destination: StrPath = Path.cwd(), members: CollectionOf[StrPath | ArchiveMember] | None = None
+        self,
+        *,
+        destination: StrPath = Path.cwd(),
+        members: CollectionOf[StrPath | ArchiveMember] | None = None,
+        workers: int = 1,
     ) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = abspath(destination)
+        if destination not in self._ensured_dirs:
+            destination.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(destination)
 
         names: set[str] = set()
         if members:
@@ -213,7 +242,7 @@ class RarFileAdapter(BaseArchiveAdapter):
                 else:
                     raise KeyError(f"{name} not found in {self._file}")
 
-        self._rarfile.extractall(path=destination, members=names, pwd=self._password)
+        self._rarfile.extractall(path=destination, members=names or None, pwd=self._password)
         return destination
 
     def read_bytes(self, member: StrPath | ArchiveMember) -> bytes:
@@ -269,6 +298,7 @@ class RarFileAdapter(BaseArchiveAdapter):
         root: StrPath | None = None,
         glob: str = "*",
         recursive: bool = True,
+        auto_store: bool = True,
     ) -> None:
         raise NotImplementedError('Cannot write to a rar file. Rar files only support mode="r"!')
 
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import os
+from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, overload
 
 from archivefile._adapters._base import BaseArchiveAdapter
 from archivefile._models import ArchiveMember
-from archivefile._utils import get_member_name, realpath
-from py7zr import SevenZipFile
+from archivefile._utils import abspath, get_member_name, iter_files, realpath
+from pydantic import ByteSize
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -22,6 +25,7 @@ if TYPE_CHECKING:
         TableStyle,
         TreeStyle,
     )
+    from py7zr.py7zr import FileInfo
     from typing_extensions import Generator, Self
 
 
@@ -53,6 +57,14 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         self._file = realpath(file)
         self._mode = mode[0]
         self._password = password
+        # Destinations that extract() and extractall() have already created.
+        # The underlying libraries recreate missing directories anyway, so this is only a shortcut.
+        self._ensured_dirs: set[Path] = set()
+        # Name to member lookup, built on first use since SevenZipFile only offers a list.
+        # Writes reset it, so it never goes stale.
+        self._sevenzipinfos: dict[str, FileInfo] | None = None
+        # Archives opened for reading can't change, so their names only need listing once.
+        self._names: tuple[str, ...] | None = None
 
         # Bit of a hack to support 'x' and 'a' modes properly
         if self._mode == "x":
@@ -71,6 +83,9 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
             # We can just set it to 'w'
             self._mode = "w"
 
+        # py7zr pulls in a whole stack of compression libraries, so only import it once a 7z archive is opened.
+        from py7zr import SevenZipFile
+
         self._sevenzipfile = SevenZipFile(self._file, mode=self._mode, password=self._password, **kwargs)
 
     def __enter__(self) -> Self:
@@ -109,48 +124,62 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
     def adapter(self) -> str:
         return self.__class__.__name__
 
+    def _get_sevenzipinfo(self, name: str) -> FileInfo | None:
+        # SevenZipFile doesn't have an equivalent for `get_member` like the rest, so we hand craft it instead.
+        # Iterating in reverse lets the first of any duplicate names win, the same as a linear search would.
+        if self._sevenzipinfos is None:
+            self._sevenzipinfos = {info.filename: info for info in reversed(self._sevenzipfile.list())}
+        return self._sevenzipinfos.get(name)
+
     def get_member(self, member: StrPath | ArchiveMember) -> ArchiveMember:
         # Unlike the rest, SevenZip member directories do not end with `/`, so we need to strip it out
         # i.e, `spam/eggs/` in a ZipFile is equivalent to `spam/eggs` in SevenZipFile
         name = get_member_name(member).removesuffix("/")
-
-        # SevenZipFile doesn't have an equivalent for `get_member` like the rest, so we hand craft it instead
-        # https://more-itertools.readthedocs.io/en/stable/_modules/more_itertools/recipes.html#first_true
-        sevenzipinfo = next(filter(lambda mem: mem.filename == name, self._sevenzipfile.list()), None)
+        sevenzipinfo = self._get_sevenzipinfo(name)
 
         # ZipFile and TarFile raise KeyError
         # So for consistency (and because I like KeyError over None), we'll also raise KeyError here
         if sevenzipinfo is None:
             raise KeyError(f"{name} not found in {self._file}")
 
-        return ArchiveMember(
+        return ArchiveMember.model_construct(
             name=sevenzipinfo.filename,
-            size=sevenzipinfo.uncompressed,
+            size=ByteSize(sevenzipinfo.uncompressed),
             # Sometimes sevenzip can return 0 for compressed size when there's no compression
             # in that case we simply return the uncompressed size instead.
-            compressed_size=sevenzipinfo.compressed or sevenzipinfo.uncompressed,
-            datetime=sevenzipinfo.creationtime,
-            checksum=sevenzipinfo.crc32,
+            compressed_size=ByteSize(sevenzipinfo.compressed or sevenzipinfo.uncompressed),
+            datetime=sevenzipinfo.creationtime.astimezone(timezone.utc)
+            if sevenzipinfo.creationtime
+            else datetime.min.replace(tzinfo=timezone.utc),
+            checksum=sevenzipinfo.crc32 or 0,
             is_dir=sevenzipinfo.is_directory,
             is_file=not sevenzipinfo.is_directory,
         )
 
     def get_members(self) -> Generator[ArchiveMember]:
         for sevenzipinfo in self._sevenzipfile.list():
-            yield ArchiveMember(
+            yield ArchiveMember.model_construct(
                 name=sevenzipinfo.filename,
-                size=sevenzipinfo.uncompressed,
+                size=ByteSize(sevenzipinfo.uncompressed),
                 # Sometimes sevenzip can return 0 for compressed size when there's no compression
                 # in that case we simply return the uncompressed size instead.
-                compressed_size=sevenzipinfo.compressed or sevenzipinfo.uncompressed,
-                datetime=sevenzipinfo.creationtime,
-                checksum=sevenzipinfo.crc32,
+                compressed_size=ByteSize(sevenzipinfo.compressed or sevenzipinfo.uncompressed),
+                datetime=sevenzipinfo.creationtime.astimezone(timezone.utc)
+                if sevenzipinfo.creationtime
+                else datetime.min.replace(tzinfo=timezone.utc),
+                checksum=sevenzipinfo.crc32 or 0,
                 is_dir=sevenzipinfo.is_directory,
                 is_file=not sevenzipinfo.is_directory,
             )
 
     def get_names(self) -> tuple[str, ...]:
-        return tuple(self._sevenzipfile.getnames())
+        if self._names is not None:
+            return self._names
+
+        names = tuple(self._sevenzipfile.getnames())
+        if self._mode[:1] == "r":
+            self._names = names
+        return names
 
     def print_tree(
         self,
@@ -163,7 +192,14 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         except ModuleNotFoundError:  # pragma: no cover
             raise ModuleNotFoundError("The 'print_tree()' method requires the 'bigtree' dependency.")
 
-        paths = [f"{self.file.name}/{member}" for member in self.get_names()]
+        names = self.get_names()
+
+        if max_depth > 0:
+            # Members nested deeper than `max_depth` are never shown, so don't bother building nodes for them.
+            # The archive itself is the root node and takes up the first level.
+            names = tuple(dict.fromkeys("/".join(name.split("/")[: max_depth - 1]) for name in names))
+
+        paths = [f"{self.file.name}/{member}" for member in names]
         tree = list_to_tree(paths)  # type: ignore
         tree.show(max_depth=max_depth, style=style)
 
@@ -193,7 +229,7 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         table.add_column("Type", no_wrap=True)
         table.add_column("Size", no_wrap=True)
         table.add_column("Compressed Size", no_wrap=True)
-        for member in sorted(members, key=lambda member: getattr(member, sort_by), reverse=descending):
+        for member in sorted(members, key=attrgetter(sort_by), reverse=descending):
             table.add_row(
                 member.name,
                 member.datetime.isoformat(),
@@ -204,14 +240,16 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         richprint(table)
 
     def extract(self, member: StrPath | ArchiveMember, *, destination: StrPath = Path.cwd()) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = abspath(destination)
+        if destination not in self._ensured_dirs:
+            destination.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(destination)
 
         # Unlike the rest, SevenZip member directories do not end with `/`, so we need to strip it out
         # i.e, `spam/eggs/` in a ZipFile is equivalent to `spam/eggs` in SevenZipFile
         name = get_member_name(member).removesuffix("/")
 
-        if name in self.get_names():
+        if self._get_sevenzipinfo(name) is not None:
             self._sevenzipfile.extract(path=destination, targets=[name], recursive=True)
         else:
             # ZipFile and TarFile raise KeyError but SevenZipFile does nothing
@@ -222,19 +260,24 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         return destination / name
 
     def extractall(
-        self, *, destination: StrPath = Path.cwd(), members: CollectionOf[StrPath | ArchiveMember] | None = None
+        self,
+        *,
+        destination: StrPath = Path.cwd(),
+        members: CollectionOf[StrPath | ArchiveMember] | None = None,
+        workers: int = 1,
     ) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = abspath(destination)
+        if destination not in self._ensured_dirs:
+            destination.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(destination)
 
         names: set[str] = set()
         if members:
-            all_members = self._sevenzipfile.getnames()
             for member in members:
                 # Unlike the rest, SevenZip member directories do not end with `/`, so we need to strip it out
                 # i.e, `spam/eggs/` in a ZipFile is equivalent to `spam/eggs` in SevenZipFile
                 name = get_member_name(member).removesuffix("/")
-                if name in all_members:
+                if self._get_sevenzipinfo(name) is not None:
                     names.add(name)
                 else:
                     raise KeyError(f"{name} not found in {self._file}")
@@ -252,7 +295,7 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         # i.e, `spam/eggs/` in a ZipFile is equivalent to `spam/eggs` in SevenZipFile
         name = get_member_name(member).removesuffix("/")
 
-        if name not in self._sevenzipfile.getnames():
+        if self._get_sevenzipinfo(name) is None:
             raise KeyError(f"{name} not found in {self._file}")
 
         data = self._sevenzipfile.read(targets=[name])
@@ -287,17 +330,13 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         arcname: StrPath | None = None,
     ) -> None:
         file = realpath(file)
-
-        match arcname:
-            case None:
-                arcname = file.name
-            case Path():
-                arcname = arcname.relative_to(arcname.anchor).as_posix()
+        name = file.name if arcname is None else get_member_name(arcname)
 
         if not file.is_file():
             raise ValueError(f"The specified file '{file}' either does not exist or is not a regular file!")
 
-        self._sevenzipfile.write(file, arcname=arcname)
+        self._sevenzipinfos = None
+        self._sevenzipfile.write(file, arcname=name)
 
     def write_text(
         self,
@@ -305,6 +344,7 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         *,
         arcname: StrPath,
     ) -> None:
+        self._sevenzipinfos = None
         self._sevenzipfile.writestr(data=data, arcname=get_member_name(arcname))
 
     def write_bytes(
@@ -313,6 +353,7 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         *,
         arcname: StrPath,
     ) -> None:
+        self._sevenzipinfos = None
         self._sevenzipfile.writestr(data=data, arcname=get_member_name(arcname))
 
     def writeall(
@@ -322,6 +363,7 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         root: StrPath | None = None,
         glob: str = "*",
         recursive: bool = True,
+        auto_store: bool = True,
     ) -> None:
         dir = realpath(dir)
 
@@ -333,14 +375,22 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         else:
             root = realpath(root)
 
-        if not dir.is_relative_to(root):
-            raise ValueError(f"{dir} must be relative to {root}")
+            if not dir.is_relative_to(root):
+                raise ValueError(f"{dir} must be relative to {root}")
+
+        # realpath() spells `dir` and `root` the same way and iter_files() only yields paths under `dir`,
+        # so slicing off the prefix of `root` is enough to get each file's arcname.
+        prefix = os.path.join(root, "")
 
-        files = dir.rglob(glob) if recursive else dir.glob(glob)
+        self._sevenzipinfos = None
 
-        for file in files:
-            arcname = file.relative_to(root)
-            self.write(file, arcname=arcname)
+        # iter_files() only yields regular files, so skip the stat() that write() would repeat to validate them.
+        # Bind the writer once instead of looking it up for every file.
+        write = self._sevenzipfile.write
+        for file in iter_files(dir, glob, recursive):
+            assert file.startswith(prefix), f"{file} is not under {root}"
+            arcname = file[len(prefix) :]
+            write(file, arcname=arcname)
 
     def close(self) -> None:
         self._sevenzipfile.close()  # type: ignore
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import os
 import tarfile
+from datetime import datetime, timezone
 from io import BytesIO
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, overload
 
 from archivefile._adapters._base import BaseArchiveAdapter
 from archivefile._models import ArchiveMember
-from archivefile._utils import get_member_name, realpath
+from archivefile._utils import abspath, get_member_name, iter_files, realpath
+from pydantic import ByteSize
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -54,6 +58,15 @@ class TarFileAdapter(BaseArchiveAdapter):
         self._file = realpath(file)
         self._mode = mode
         self._password = password
+        # Destinations that extract() and extractall() have already created.
+        # The underlying libraries recreate missing directories anyway, so this is only a shortcut.
+        self._ensured_dirs: set[Path] = set()
+        # Archives opened for reading can't change, so their names only need listing once.
+        self._names: tuple[str, ...] | None = None
+        # TarFile.getmember() searches the member list linearly, so archives opened for reading index it once.
+        self._tarinfos: dict[str, tarfile.TarInfo] | None = None
+        # TarFile copies member data in 16 KiB chunks unless told otherwise, larger ones cut the per-chunk overhead.
+        kwargs.setdefault("copybufsize", 1024 * 1024)
         self._tarfile = tarfile.open(self._file, mode=self._mode, **kwargs)
         # https://docs.python.org/3/library/tarfile.html#supporting-older-python-versions
         self._tarfile.extraction_filter = getattr(tarfile, "data_filter", (lambda member, path: member))
@@ -94,35 +107,56 @@ class TarFileAdapter(BaseArchiveAdapter):
     def adapter(self) -> str:
         return self.__class__.__name__
 
+    def _get_tarinfo(self, name: str) -> tarfile.TarInfo:
+        if self._mode[:1] != "r":
+            return self._tarfile.getmember(name)
+
+        if self._tarinfos is None:
+            # Later entries overwrite earlier ones, matching TarFile.getmember() which searches from the end.
+            self._tarinfos = {tarinfo.name: tarinfo for tarinfo in self._tarfile.getmembers()}
+
+        try:
+            return self._tarinfos[name.rstrip("/")]
+        except KeyError:
+            raise KeyError(f"filename {name!r} not found") from None
+
     def get_member(self, member: StrPath | ArchiveMember) -> ArchiveMember:
         name = get_member_name(member)
 
-        tarinfo = self._tarfile.getmember(name)
+        tarinfo = self._get_tarinfo(name)
+        is_dir = tarinfo.isdir()
 
-        return ArchiveMember(
+        return ArchiveMember.model_construct(
             name=tarinfo.name,
-            size=tarinfo.size,  # type: ignore
-            compressed_size=tarinfo.size,  # type: ignore
-            datetime=tarinfo.mtime,  # type: ignore
+            size=ByteSize(tarinfo.size),
+            compressed_size=ByteSize(tarinfo.size),
+            datetime=datetime.fromtimestamp(tarinfo.mtime, timezone.utc),
             checksum=tarinfo.chksum,
-            is_dir=tarinfo.isdir(),
-            is_file=tarinfo.isfile(),
+            is_dir=is_dir,
+            is_file=not is_dir and tarinfo.isfile(),
         )
 
     def get_members(self) -> Generator[ArchiveMember]:
         for tarinfo in self._tarfile.getmembers():
-            yield ArchiveMember(
+            is_dir = tarinfo.isdir()
+            yield ArchiveMember.model_construct(
                 name=tarinfo.name,
-                size=tarinfo.size,  # type: ignore
-                compressed_size=tarinfo.size,  # type: ignore
-                datetime=tarinfo.mtime,  # type: ignore
+                size=ByteSize(tarinfo.size),
+                compressed_size=ByteSize(tarinfo.size),
+                datetime=datetime.fromtimestamp(tarinfo.mtime, timezone.utc),
                 checksum=tarinfo.chksum,
-                is_dir=tarinfo.isdir(),
-                is_file=tarinfo.isfile(),
+                is_dir=is_dir,
+                is_file=not is_dir and tarinfo.isfile(),
             )
 
     def get_names(self) -> tuple[str, ...]:
-        return tuple(self._tarfile.getnames())
+        if self._names is not None:
+            return self._names
+
+        names = tuple(self._tarfile.getnames())
+        if self._mode[:1] == "r":
+            self._names = names
+        return names
 
     def print_tree(
         self,
@@ -135,7 +169,14 @@ class TarFileAdapter(BaseArchiveAdapter):
         except ModuleNotFoundError:  # pragma: no cover
             raise ModuleNotFoundError("The 'print_tree()' method requires the 'bigtree' dependency.")
 
-        paths = [f"{self.file.name}/{member}" for member in self.get_names()]
+        names = self.get_names()
+
+        if max_depth > 0:
+            # Members nested deeper than `max_depth` are never shown, so don't bother building nodes for them.
+            # The archive itself is the root node and takes up the first level.
+            names = tuple(dict.fromkeys("/".join(name.split("/")[: max_depth - 1]) for name in names))
+
+        paths = [f"{self.file.name}/{member}" for member in names]
         tree = list_to_tree(paths)  # type: ignore
         tree.show(max_depth=max_depth, style=style)
 
@@ -165,7 +206,7 @@ class TarFileAdapter(BaseArchiveAdapter):
         table.add_column("Type", no_wrap=True)
         table.add_column("Size", no_wrap=True)
         table.add_column("Compressed Size", no_wrap=True)
-        for member in sorted(members, key=lambda member: getattr(member, sort_by), reverse=descending):
+        for member in sorted(members, key=attrgetter(sort_by), reverse=descending):
             table.add_row(
                 member.name,
                 member.datetime.isoformat(),
@@ -176,23 +217,31 @@ class TarFileAdapter(BaseArchiveAdapter):
         richprint(table)
 
     def extract(self, member: StrPath | ArchiveMember, *, destination: StrPath = Path.cwd()) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = abspath(destination)
+        if destination not in self._ensured_dirs:
+            destination.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(destination)
 
         name = get_member_name(member)
-        self._tarfile.extract(member=name, path=destination)
+        self._tarfile.extract(member=self._get_tarinfo(name), path=destination)
         return destination / name
 
     def extractall(
-        self, *, destination: StrPath = Path.cwd(), members: CollectionOf[StrPath | ArchiveMember] | None = None
+        self,
+        *,
+        destination: StrPath = Path.cwd(),
+        members: CollectionOf[StrPath | ArchiveMember] | None = None,
+        workers: int = 1,
     ) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = abspath(destination)
+        if destination not in self._ensured_dirs:
+            destination.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(destination)
 
         names: list[tarfile.TarInfo] = []
         if members:
             for member in members:
-                names.append(self._tarfile.getmember(get_member_name(member)))
+                names.append(self._get_tarinfo(get_member_name(member)))
 
             self._tarfile.extractall(path=destination, members=names)
 
@@ -203,7 +252,7 @@ class TarFileAdapter(BaseArchiveAdapter):
 
     def read_bytes(self, member: StrPath | ArchiveMember) -> bytes:
         name = get_member_name(member)
-        fileobj = self._tarfile.extractfile(name)
+        fileobj = self._tarfile.extractfile(self._get_tarinfo(name))
         if fileobj is None:  # pragma: no cover
             return b""
         return fileobj.read()
@@ -224,14 +273,12 @@ class TarFileAdapter(BaseArchiveAdapter):
         arcname: StrPath | None = None,
     ) -> None:
         file = realpath(file)
-
-        if arcname is None:
-            arcname = file.name
+        name = file.name if arcname is None else get_member_name(arcname)
 
         if not file.is_file():
             raise ValueError(f"The specified file '{file}' either does not exist or is not a regular file!")
 
-        self._tarfile.add(file, arcname=arcname)
+        self._tarfile.add(file, arcname=name)
 
     def write_text(
         self,
@@ -258,6 +305,7 @@ class TarFileAdapter(BaseArchiveAdapter):
         root: StrPath | None = None,
         glob: str = "*",
         recursive: bool = True,
+        auto_store: bool = True,
     ) -> None:
         dir = realpath(dir)
 
@@ -269,15 +317,20 @@ class TarFileAdapter(BaseArchiveAdapter):
         else:
             root = realpath(root)
 
-        if not dir.is_relative_to(root):
-            raise ValueError(f"{dir} must be relative to {root}")
+            if not dir.is_relative_to(root):
+                raise ValueError(f"{dir} must be relative to {root}")
 
-        files = dir.rglob(glob) if recursive else dir.glob(glob)
+        # realpath() spells `dir` and `root` the same way and iter_files() only yields paths under `dir`,
+        # so slicing off the prefix of `root` is enough to get each file's arcname.
+        prefix = os.path.join(root, "")
 
-        for file in files:
-            if file.is_file():
-                arcname = file.relative_to(root)
-                self.write(file, arcname=arcname)
+        # iter_files() only yields regular files, so skip the stat() that write() would repeat to validate them.
+        # Bind the writer once instead of looking it up for every file.
+        write = self._tarfile.add
+        for file in iter_files(dir, glob, recursive):
+            assert file.startswith(prefix), f"{file} is not under {root}"
+            arcname = file[len(prefix) :]
+            write(file, arcname=arcname)
 
     def close(self) -> None:
         self._tarfile.close()
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, overload
 from zipfile import ZipFile
@@ -8,7 +11,8 @@ from zipfile import ZipFile
 from archivefile._adapters._base import BaseArchiveAdapter
 from archivefile._enums import CompressionType
 from archivefile._models import ArchiveMember
-from archivefile._utils import clamp_compression_level, get_member_name, realpath
+from archivefile._utils import abspath, clamp_compression_level, get_member_name, iter_files, realpath
+from pydantic import ByteSize
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -25,6 +29,15 @@ if TYPE_CHECKING:
     )
     from typing_extensions import Generator, Self
 
+# Formats that are compressed already, compressing them again costs time for next to no gain.
+_COMPRESSED_SUFFIXES = frozenset(
+    {
+        ".7z", ".avif", ".br", ".bz2", ".cb7", ".cbr", ".cbz", ".flac", ".gif", ".gz", ".heic", ".jpeg",
+        ".jpg", ".lz4", ".m4a", ".mkv", ".mov", ".mp3", ".mp4", ".ogg", ".opus", ".png", ".rar", ".webm",
+        ".webp", ".xz", ".zip", ".zst",
+    }
+)  # fmt: skip
+
 
 class ZipFileAdapter(BaseArchiveAdapter):
     # fmt: off
@@ -54,7 +67,14 @@ class ZipFileAdapter(BaseArchiveAdapter):
         self._file = realpath(file)
         self._mode = mode[0]
         self._password = password
+        # Destinations that extract() and extractall() have already created.
+        # The underlying libraries recreate missing directories anyway, so this is only a shortcut.
+        self._ensured_dirs: set[Path] = set()
+        # Archives opened for reading can't change, so their names only need listing once.
+        self._names: tuple[str, ...] | None = None
         self._pwd = password.encode() if password else None
+        # Kept so the handles opened by extractall() workers read the archive the same way
+        self._kwargs = kwargs
 
         self._compression_type = CompressionType.get(compression_type)
         self._compression_level = clamp_compression_level(compression_level) if compression_level is not None else None
@@ -69,7 +89,7 @@ class ZipFileAdapter(BaseArchiveAdapter):
             mode=self._mode,
             compression=self._compression_type,
             compresslevel=self._compression_level,
-            **kwargs,
+            **self._kwargs,
         )  # type: ignore
 
     def __enter__(self) -> Self:
@@ -107,31 +127,39 @@ class ZipFileAdapter(BaseArchiveAdapter):
     def get_member(self, member: StrPath | ArchiveMember) -> ArchiveMember:
         name = get_member_name(member)
         zipinfo = self._zipfile.getinfo(name)
+        is_dir = zipinfo.filename.endswith("/")
 
-        return ArchiveMember(
+        return ArchiveMember.model_construct(
             name=zipinfo.filename,
-            size=zipinfo.file_size,
-            compressed_size=zipinfo.compress_size,
-            datetime=datetime(*zipinfo.date_time),
+            size=ByteSize(zipinfo.file_size),
+            compressed_size=ByteSize(zipinfo.compress_size),
+            datetime=datetime(*zipinfo.date_time).astimezone(timezone.utc),
             checksum=zipinfo.CRC,
-            is_dir=zipinfo.is_dir(),
-            is_file=not zipinfo.is_dir(),
+            is_dir=is_dir,
+            is_file=not is_dir,
         )
 
     def get_members(self) -> Generator[ArchiveMember]:
         for zipinfo in self._zipfile.filelist:
-            yield ArchiveMember(
+            is_dir = zipinfo.filename.endswith("/")
+            yield ArchiveMember.model_construct(
                 name=zipinfo.filename,
-                size=zipinfo.file_size,
-                compressed_size=zipinfo.compress_size,
-                datetime=datetime(*zipinfo.date_time),
+                size=ByteSize(zipinfo.file_size),
+                compressed_size=ByteSize(zipinfo.compress_size),
+                datetime=datetime(*zipinfo.date_time).astimezone(timezone.utc),
                 checksum=zipinfo.CRC,
-                is_dir=zipinfo.is_dir(),
-                is_file=not zipinfo.is_dir(),
+                is_dir=is_dir,
+                is_file=not is_dir,
             )
 
     def get_names(self) -> tuple[str, ...]:
-        return tuple(self._zipfile.namelist())
+        if self._names is not None:
+            return self._names
+
+        names = tuple(self._zipfile.namelist())
+        if self._mode[:1] == "r":
+            self._names = names
+        return names
 
     def print_tree(
         self,
@@ -144,7 +172,14 @@ class ZipFileAdapter(BaseArchiveAdapter):
         except ModuleNotFoundError:  # pragma: no cover
             raise ModuleNotFoundError("The 'print_tree()' method requires the 'bigtree' dependency.")
 
-        paths = [f"{self.file.name}/{member}" for member in self.get_names()]
+        names = self.get_names()
+
+        if max_depth > 0:
+            # Members nested deeper than `max_depth` are never shown, so don't bother building nodes for them.
+            # The archive itself is the root node and takes up the first level.
+            names = tuple(dict.fromkeys("/".join(name.split("/")[: max_depth - 1]) for name in names))
+
+        paths = [f"{self.file.name}/{member}" for member in names]
         tree = list_to_tree(paths)  # type: ignore
         tree.show(max_depth=max_depth, style=style)
 
@@ -174,7 +209,7 @@ class ZipFileAdapter(BaseArchiveAdapter):
         table.add_column("Type", no_wrap=True)
         table.add_column("Size", no_wrap=True)
         table.add_column("Compressed Size", no_wrap=True)
-        for member in sorted(members, key=lambda member: getattr(member, sort_by), reverse=descending):
+        for member in sorted(members, key=attrgetter(sort_by), reverse=descending):
             table.add_row(
                 member.name,
                 member.datetime.isoformat(),
@@ -185,31 +220,72 @@ class ZipFileAdapter(BaseArchiveAdapter):
         richprint(table)
 
     def extract(self, member: StrPath | ArchiveMember, *, destination: StrPath = Path.cwd()) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = abspath(destination)
+        if destination not in self._ensured_dirs:
+            destination.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(destination)
 
         name = get_member_name(member)
         self._zipfile.extract(member=name, path=destination, pwd=self._pwd)
         return destination / name
 
     def extractall(
-        self, *, destination: StrPath = Path.cwd(), members: CollectionOf[StrPath | ArchiveMember] | None = None
+        self,
+        *,
+        destination: StrPath = Path.cwd(),
+        members: CollectionOf[StrPath | ArchiveMember] | None = None,
+        workers: int = 1,
     ) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = abspath(destination)
+        if destination not in self._ensured_dirs:
+            destination.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(destination)
 
         names: list[str] = []
         if members:
             for member in members:
                 names.append(get_member_name(member))
 
-        if names:
+        if workers > 1 and self._mode == "r":
+            self._extractall_threaded(destination, names or self._zipfile.namelist(), workers)
+        elif names:
             self._zipfile.extractall(path=destination, members=names, pwd=self._pwd)
         else:
             self._zipfile.extractall(path=destination, pwd=self._pwd)
 
         return destination
 
+    def _extractall_threaded(self, destination: Path, names: list[str], workers: int) -> None:
+        # Two workers extracting the same member would write to the same file at once
+        names = list(dict.fromkeys(names))
+
+        # Never start more threads than there are members to extract
+        workers = min(workers, len(names))
+        if not workers:
+            return
+
+        # Raise KeyError for missing members before touching the destination
+        for name in names:
+            self._zipfile.getinfo(name)
+
+        # ZipFile creates missing directories without `exist_ok=True`, so concurrent workers can race each other.
+        # Create them all upfront instead, sanitizing member names the same way ZipFile does.
+        for name in names:
+            parts = [part for part in name.split("/") if part not in ("", ".", "..")]
+            directory = destination.joinpath(*parts) if name.endswith("/") else destination.joinpath(*parts[:-1])
+            directory.mkdir(parents=True, exist_ok=True)
+
+        def extract(chunk: list[str]) -> None:
+            # ZipFile handles aren't thread-safe, so each worker reads from its own.
+            # zlib, bz2, and lzma release the GIL while decompressing, which lets the workers run in parallel.
+            with ZipFile(self._file, **self._kwargs) as zipfile:
+                for name in chunk:
+                    zipfile.extract(member=name, path=destination, pwd=self._pwd)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the iterator so exceptions raised by the workers propagate
+            list(executor.map(extract, [names[i::workers] for i in range(workers)]))
+
     def read_bytes(self, member: StrPath | ArchiveMember) -> bytes:
         name = get_member_name(member)
         return self._zipfile.read(name, pwd=self._pwd)  # type: ignore
@@ -230,14 +306,12 @@ class ZipFileAdapter(BaseArchiveAdapter):
         arcname: StrPath | None = None,
     ) -> None:
         file = realpath(file)
-
-        if arcname is None:
-            arcname = file.name
+        name = file.name if arcname is None else get_member_name(arcname)
 
         if not file.is_file():
             raise ValueError(f"The specified file '{file}' either does not exist or is not a regular file!")
 
-        self._zipfile.write(file, arcname=arcname)
+        self._zipfile.write(file, arcname=name)
 
     def write_text(
         self,
@@ -262,6 +336,7 @@ class ZipFileAdapter(BaseArchiveAdapter):
         root: StrPath | None = None,
         glob: str = "*",
         recursive: bool = True,
+        auto_store: bool = True,
     ) -> None:
         dir = realpath(dir)
 
@@ -273,14 +348,22 @@ class ZipFileAdapter(BaseArchiveAdapter):
         else:
             root = realpath(root)
 
-        if not dir.is_relative_to(root):
-            raise ValueError(f"{dir} must be relative to {root}")
-
-        files = dir.rglob(glob) if recursive else dir.glob(glob)
-
-        for file in files:
-            arcname = file.relative_to(root)
-            self.write(file, arcname=arcname)
+            if not dir.is_relative_to(root):
+                raise ValueError(f"{dir} must be relative to {root}")
+
+        # realpath() spells `dir` and `root` the same way and iter_files() only yields paths under `dir`,
+        # so slicing off the prefix of `root` is enough to get each file's arcname.
+        prefix = os.path.join(root, "")
+
+        # iter_files() only yields regular files, so skip the stat() that write() would repeat to validate them.
+        # Bind the writer once instead of looking it up for every file.
+        write = self._zipfile.write
+        for file in iter_files(dir, glob, recursive):
+            suffix = os.path.splitext(file)[1].lower()
+            compress_type = CompressionType.STORED if auto_store and suffix in _COMPRESSED_SUFFIXES else None
+            assert file.startswith(prefix), f"{file} is not under {root}"
+            arcname = file[len(prefix) :]
+            write(file, arcname=arcname, compress_type=compress_type)
 
     def close(self) -> None:
         self._zipfile.close()
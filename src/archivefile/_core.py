@@ -1,13 +1,11 @@
 from __future__ import annotations
 
-import re
 from pathlib import Path
 from tarfile import is_tarfile
 from types import TracebackType
-from typing import Any, overload
+from typing import Any, TypeAlias, Union, overload
 from zipfile import is_zipfile
 
-from py7zr import is_7zfile
 from pydantic import validate_call
 from rarfile import is_rarfile, is_rarfile_sfx
 from typing_extensions import Generator, Self
@@ -20,6 +18,7 @@ from archivefile._adapters._zip import ZipFileAdapter
 from archivefile._enums import CompressionType
 from archivefile._models import ArchiveMember
 from archivefile._types import (
+    ArchiveFormat,
     CollectionOf,
     CompressionLevel,
     ErrorHandler,
@@ -29,10 +28,57 @@ from archivefile._types import (
     TableStyle,
     TreeStyle,
 )
-from archivefile._utils import realpath
+from archivefile._utils import is_sevenzipfile, realpath, sniff_format
+
+_AdapterType: TypeAlias = Union[
+    type[ZipFileAdapter], type[TarFileAdapter], type[SevenZipFileAdapter], type[RarFileAdapter]
+]
+
+_ADAPTERS: dict[ArchiveFormat, _AdapterType] = {
+    "zip": ZipFileAdapter,
+    "tar": TarFileAdapter,
+    "7z": SevenZipFileAdapter,
+    "rar": RarFileAdapter,
+}
+
+# Adapters for the extensions accepted when creating a new archive.
+_EXTENSIONS: dict[str, _AdapterType] = {
+    "zip": ZipFileAdapter,
+    "cbz": ZipFileAdapter,
+    "tar": TarFileAdapter,
+    "tar.bz2": TarFileAdapter,
+    "tar.gz": TarFileAdapter,
+    "tar.xz": TarFileAdapter,
+    "cbt": TarFileAdapter,
+    "7z": SevenZipFileAdapter,
+    "cb7": SevenZipFileAdapter,
+    "rar": RarFileAdapter,
+    "cbr": RarFileAdapter,
+}
+
+
+def _adapter_for_extension(filename: str) -> _AdapterType | None:
+    """Pick an adapter from the extension of a file name, trying double extensions like `.tar.gz` first."""
+    parts = filename.lower().split(".")
+    if len(parts) > 2 and (adapter := _EXTENSIONS.get(".".join(parts[-2:]))):
+        return adapter
+    if len(parts) > 1:
+        return _EXTENSIONS.get(parts[-1])
+    return None
 
 
 class ArchiveFile(BaseArchiveAdapter):
+    __slots__ = (
+        "_file",
+        "_mode",
+        "_password",
+        "_kwargs",
+        "_compression_type",
+        "_compression_level",
+        "_adapter",
+        "__weakref__",
+    )
+
     # fmt: off
     @overload
     def __init__(self, file: StrPath, mode: OpenArchiveMode = "r", *, password: str | None = None, compression_type: CompressionType | None = None, compression_level: CompressionLevel | None = None, **kwargs: Any) -> None: ...
@@ -90,6 +136,10 @@ class ArchiveFile(BaseArchiveAdapter):
         The `compression_type` and `compression_level` parameters are only applicable when creating
         zip files and do not affect reading zip files or other archive formats.
 
+        When `compression_level` is not given, the backend's default is used, which is 6 for deflate.
+        Level 1 is several times faster and usually produces archives only slightly larger,
+        so it is a good choice when write speed matters more than size.
+
         References
         ----------
         ArchiveFile currently supports the following:
@@ -110,32 +160,26 @@ class ArchiveFile(BaseArchiveAdapter):
     def _initialize_adapter(self) -> None:
         if not self._file.exists():
             if not self._mode.startswith("r"):
-                filename = self._file.name.lower()
-
-                if re.search(r"\.(zip|cbz)$", filename):
-                    adapter = ZipFileAdapter
-                elif re.search(r"\.((tar(\.(bz2|gz|xz))?)|(cbt))$", filename):
-                    adapter = TarFileAdapter  # type: ignore
-                elif re.search(r"\.(7z|cb7)$", filename):
-                    adapter = SevenZipFileAdapter  # type: ignore
-                elif re.search(r"\.(rar|cbr)$", filename):
-                    adapter = RarFileAdapter  # type: ignore
-                else:
+                adapter = _adapter_for_extension(self._file.name)
+                if adapter is None:
                     raise NotImplementedError(f"Unsupported archive format: {self._file}")
             else:
                 raise FileNotFoundError(self._file)
 
+        elif archive_format := sniff_format(self._file):
+            adapter = _ADAPTERS[archive_format]
+
         elif is_zipfile(self._file):
             adapter = ZipFileAdapter
 
         elif is_tarfile(self._file):
-            adapter = TarFileAdapter  # type: ignore
+            adapter = TarFileAdapter
 
-        elif is_7zfile(self._file):
-            adapter = SevenZipFileAdapter  # type: ignore
+        elif is_sevenzipfile(self._file):
+            adapter = SevenZipFileAdapter
 
         elif is_rarfile(self._file) or is_rarfile_sfx(self._file):
-            adapter = RarFileAdapter  # type: ignore
+            adapter = RarFileAdapter
 
         else:
             raise NotImplementedError(f"Unsupported archive format: {self._file}")
@@ -187,7 +231,6 @@ class ArchiveFile(BaseArchiveAdapter):
         """Name of the underlying adapter class, useful for debugging."""
         return self._adapter.adapter
 
-    @validate_call
     def get_member(self, member: StrPath | ArchiveMember) -> ArchiveMember:
         """
         Retrieve an ArchiveMember object by it's name.
@@ -219,7 +262,6 @@ class ArchiveFile(BaseArchiveAdapter):
         """
         return self._adapter.get_member(member)
 
-    @validate_call
     def get_members(self) -> Generator[ArchiveMember]:
         """
         Retrieve all members of the archive as a generator of `ArchiveMember` objects.
@@ -243,7 +285,6 @@ class ArchiveFile(BaseArchiveAdapter):
         """
         yield from self._adapter.get_members()
 
-    @validate_call
     def get_names(self) -> tuple[str, ...]:
         """
         Retrieve all members of the archive as a tuple of strings.
@@ -379,7 +420,6 @@ class ArchiveFile(BaseArchiveAdapter):
         """
         self._adapter.print_table(title=title, style=style, sort_by=sort_by, descending=descending, **kwargs)
 
-    @validate_call
     def extract(self, member: StrPath | ArchiveMember, *, destination: StrPath = Path.cwd()) -> Path:
         """
         Extract a member of the archive.
@@ -422,7 +462,11 @@ class ArchiveFile(BaseArchiveAdapter):
 
     @validate_call
     def extractall(
-        self, *, destination: StrPath = Path.cwd(), members: CollectionOf[StrPath | ArchiveMember] | None = None
+        self,
+        *,
+        destination: StrPath = Path.cwd(),
+        members: CollectionOf[StrPath | ArchiveMember] | None = None,
+        workers: int = 1,
     ) -> Path:
         """
         Extract all the members of the archive to the destination directory.
@@ -435,6 +479,8 @@ class ArchiveFile(BaseArchiveAdapter):
         members : CollectionOf[StrPath | ArchiveMember], optional
             Collection of member names or ArchiveMember objects to extract.
             Default is `None` which will extract all members.
+        workers : int, optional
+            Number of threads used to extract the members. Must be at least 1. Default is 1.
 
         Returns
         -------
@@ -445,6 +491,14 @@ class ArchiveFile(BaseArchiveAdapter):
         ------
         KeyError
             Raised if any member in members was not found in the archive.
+        ValueError
+            Raised if workers is less than 1.
+
+        Notes
+        -----
+        Only ZipFile supports extracting with more than one worker, and only when the archive is opened in read mode.
+        Every other archive format always extracts members one after the other.
+        No more threads are started than there are members to extract.
 
         Examples
         --------
@@ -466,9 +520,11 @@ class ArchiveFile(BaseArchiveAdapter):
             # /source/hello-world/tests/__init__.py
         ```
         """
-        return self._adapter.extractall(destination=destination, members=members)
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, not {workers}")
+
+        return self._adapter.extractall(destination=destination, members=members, workers=workers)
 
-    @validate_call
     def read_bytes(self, member: StrPath | ArchiveMember) -> bytes:
         """
         Read the member in bytes mode.
@@ -597,7 +653,6 @@ class ArchiveFile(BaseArchiveAdapter):
         """
         self._adapter.write(file, arcname=arcname)
 
-    @validate_call
     def write_text(
         self,
         data: str,
@@ -618,6 +673,11 @@ class ArchiveFile(BaseArchiveAdapter):
         -------
         None
 
+        Raises
+        ------
+        TypeError
+            Raised if `data` is not a string.
+
         Examples
         --------
         ```py
@@ -633,9 +693,13 @@ class ArchiveFile(BaseArchiveAdapter):
             # 'spam and eggs'
         ```
         """
+        # Checked by hand rather than with `validate_call`, which costs far more per call than the write itself
+        # for the many small writes this method is typically used for.
+        if not isinstance(data, str):
+            raise TypeError(f"data must be str, not {type(data).__name__}")
+
         self._adapter.write_text(data, arcname=arcname)
 
-    @validate_call
     def write_bytes(
         self,
         data: bytes,
@@ -656,6 +720,11 @@ class ArchiveFile(BaseArchiveAdapter):
         -------
         None
 
+        Raises
+        ------
+        TypeError
+            Raised if `data` is not a bytes-like object.
+
         Examples
         --------
         ```py
@@ -671,6 +740,10 @@ class ArchiveFile(BaseArchiveAdapter):
             # b"010010100101"
         ```
         """
+        # Checked by hand rather than with `validate_call`, see `write_text()`.
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError(f"data must be a bytes-like object, not {type(data).__name__}")
+
         self._adapter.write_bytes(data, arcname=arcname)
 
     @validate_call
@@ -681,6 +754,7 @@ class ArchiveFile(BaseArchiveAdapter):
         root: StrPath | None = None,
         glob: str = "*",
         recursive: bool = True,
+        auto_store: bool = True,
     ) -> None:
         """
         Write a directory to the archive.
@@ -696,11 +770,19 @@ class ArchiveFile(BaseArchiveAdapter):
             Only write files that match this glob pattern to the archive.
         recursive : bool, optional
             Recursively write all the files in the given directory. Default is True.
+        auto_store : bool, optional
+            Store files that are already compressed (images, audio, video and archives) as is
+            instead of compressing them again, even if `compression_type` asks for compression.
+            Set this to False to compress every file with `compression_type`. Default is True.
 
         Returns
         -------
         None
 
+        Notes
+        -----
+        `auto_store` only applies to zip files.
+
         Examples
         --------
         ```py
@@ -726,6 +808,7 @@ class ArchiveFile(BaseArchiveAdapter):
             root=root,
             glob=glob,
             recursive=recursive,
+            auto_store=auto_store,
         )
 
     def close(self) -> None:
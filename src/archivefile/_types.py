@@ -38,6 +38,9 @@ OpenArchiveMode: TypeAlias = Literal[
     "a:",
 ]
 
+ArchiveFormat: TypeAlias = Literal["zip", "tar", "7z", "rar"]
+"""Archive formats that can be told apart by their leading bytes."""
+
 TreeStyle: TypeAlias = Literal["ansi", "ascii", "const", "const_bold", "rounded", "double"]
 
 TableStyle: TypeAlias = Literal[
@@ -1,14 +1,33 @@
 from __future__ import annotations
 
+import os
+from fnmatch import fnmatch
 from pathlib import Path
 from tarfile import is_tarfile
+from typing import TYPE_CHECKING
 from zipfile import is_zipfile
 
-from py7zr import is_7zfile
 from rarfile import is_rarfile, is_rarfile_sfx
 
 from archivefile._models import ArchiveMember
-from archivefile._types import StrPath
+from archivefile._types import ArchiveFormat, StrPath
+
+if TYPE_CHECKING:
+    from typing_extensions import Generator
+
+# Leading bytes of the formats that can be recognized without asking every library in turn.
+# Compressed tarballs, old V7 tarballs and self-extracting archives have no such signature
+# and go through the `is_*` checks.
+_MAGIC_NUMBERS: dict[bytes, ArchiveFormat] = {
+    b"PK\x03\x04": "zip",
+    b"PK\x05\x06": "zip",  # Empty zip, which is nothing but the end of central directory record
+    b"7z\xbc\xaf\x27\x1c": "7z",
+    b"Rar!\x1a\x07": "rar",
+}
+
+# POSIX and GNU tar headers both carry this magic at offset 257 of the first block.
+_TAR_MAGIC = b"ustar"
+_TAR_MAGIC_OFFSET = 257
 
 
 def realpath(path: StrPath) -> Path:
@@ -28,6 +47,34 @@ def realpath(path: StrPath) -> Path:
     return path.expanduser().resolve() if isinstance(path, Path) else Path(path).expanduser().resolve()
 
 
+def abspath(path: StrPath) -> Path:
+    """
+    Get an absolute path for a given file or directory, without resolving symbolic links if it already is one.
+
+    Parameters
+    ----------
+    path : str or Path
+        A string representing a path or a Path object.
+
+    Returns
+    -------
+    Path
+        The path as is if it is absolute and has no `..` components, otherwise the same as `realpath()`.
+
+    Notes
+    -----
+    `resolve()` costs a `stat()` call per path component. This skips it for paths whose
+    symlink identity doesn't matter, such as extraction destinations. Anything that is compared
+    against another path, like the directories in `writeall()`, must go through `realpath()`.
+    """
+    path = path if isinstance(path, Path) else Path(path)
+
+    if path.is_absolute() and ".." not in path.parts:
+        return path
+
+    return realpath(path)
+
+
 def is_archive(file: StrPath) -> bool:
     """
     Check whether the given archive file is a supported archive or not.
@@ -45,23 +92,112 @@ def is_archive(file: StrPath) -> bool:
     file = realpath(file)
 
     if file.exists():
-        return is_tarfile(file) or is_zipfile(file) or is_rarfile(file) or is_rarfile_sfx(file) or is_7zfile(file)
+        return (
+            sniff_format(file) is not None
+            or is_tarfile(file)
+            or is_zipfile(file)
+            or is_rarfile(file)
+            or is_rarfile_sfx(file)
+            or is_sevenzipfile(file)
+        )
     else:
         return False
 
 
+def sniff_format(file: Path) -> ArchiveFormat | None:
+    """
+    Recognize an archive from its leading bytes, which takes a single read.
+
+    Parameters
+    ----------
+    file : Path
+        Path to the archive file.
+
+    Returns
+    -------
+    ArchiveFormat | None
+        The format of the archive, or None if its leading bytes are not conclusive.
+    """
+    with file.open("rb") as f:
+        head = f.read(_TAR_MAGIC_OFFSET + len(_TAR_MAGIC))
+
+    for magic, archive_format in _MAGIC_NUMBERS.items():
+        if head.startswith(magic):
+            return archive_format
+
+    if head[_TAR_MAGIC_OFFSET:] == _TAR_MAGIC:
+        return "tar"
+    return None
+
+
+def is_sevenzipfile(file: StrPath) -> bool:
+    """
+    Check whether the given file is a 7z archive.
+
+    Wraps `py7zr.is_7zfile` so that py7zr, which pulls in a whole stack of
+    compression libraries, is only imported once a file actually needs checking.
+    """
+    from py7zr import is_7zfile
+
+    return is_7zfile(file)
+
+
 def get_member_name(member: StrPath | ArchiveMember) -> str:
     """Get the member name from a string, path, or ArchiveMember"""
 
-    match member:
-        case ArchiveMember():
-            return member.name
+    # Plain names are the most common case, so they are checked first. This runs once per member
+    # and isinstance() chains are quicker than `match` class patterns, which also end up
+    # going through pydantic's metaclass for ArchiveMember before reaching str.
+    if isinstance(member, str):
+        return member
+
+    if isinstance(member, ArchiveMember):
+        return member.name
+
+    if isinstance(member, Path):
+        return member.relative_to(member.anchor).as_posix()
+
+    raise TypeError(f"member must be str, Path, or ArchiveMember, not {type(member).__name__}")
+
+
+def iter_files(dir: Path, glob: str = "*", recursive: bool = True) -> Generator[str]:
+    """
+    Yield the paths of the regular files in a directory whose names match a glob pattern.
 
-        case Path():
-            return member.relative_to(member.anchor).as_posix()
+    Parameters
+    ----------
+    dir : Path
+        Directory to walk.
+    glob : str, optional
+        Glob pattern matched against each file name.
+    recursive : bool, optional
+        Descend into subdirectories. Default is True.
 
-        case _:
-            return member
+    Returns
+    -------
+    Generator[str]
+        Paths of the matching files, in no particular order.
+
+    Notes
+    -----
+    Walks the tree with `os.scandir()`, whose entries already know their own type,
+    instead of creating and stat-ing a `Path` for every entry like `Path.rglob()`.
+    Patterns that span directories are handed to `Path.rglob()`/`Path.glob()`.
+    """
+    if os.sep in glob or "/" in glob or "**" in glob:
+        files = dir.rglob(glob) if recursive else dir.glob(glob)
+        yield from (str(file) for file in files if file.is_file())
+        return
+
+    pending = [os.fspath(dir)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                elif fnmatch(entry.name, glob) and entry.is_file():
+                    yield entry.path
 
 
 def clamp_compression_level(level: int) -> int:
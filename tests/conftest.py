@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import rarfile
+
+# Resolved against this file rather than the working directory, so the suite can run from anywhere
+TEST_DATA = Path(__file__).parent.resolve() / "test_data"
+
+files = (
+    TEST_DATA / "source_BEST.rar",
+    TEST_DATA / "source_BZIP2.7z",
+    TEST_DATA / "source_BZIP2.zip",
+    TEST_DATA / "source_DEFLATE.zip",
+    TEST_DATA / "source_DEFLATE64.zip",
+    TEST_DATA / "source_GNU.tar",
+    TEST_DATA / "source_GNU.tar.bz2",
+    TEST_DATA / "source_GNU.tar.gz",
+    TEST_DATA / "source_GNU.tar.xz",
+    TEST_DATA / "source_LZMA.7z",
+    TEST_DATA / "source_LZMA.zip",
+    TEST_DATA / "source_LZMA2.7z",
+    TEST_DATA / "source_POSIX.tar",
+    TEST_DATA / "source_POSIX.tar.bz2",
+    TEST_DATA / "source_POSIX.tar.gz",
+    TEST_DATA / "source_POSIX.tar.xz",
+    TEST_DATA / "source_PPMD.7z",
+    TEST_DATA / "source_PPMD.zip",
+    TEST_DATA / "source_STORE.7z",
+    TEST_DATA / "source_LZMA_SOLID.7z",
+    TEST_DATA / "source_LZMA2_SOLID.7z",
+    TEST_DATA / "source_PPMD_SOLID.7z",
+    TEST_DATA / "source_BZIP2_SOLID.7z",
+    TEST_DATA / "source_STORE.rar",
+    TEST_DATA / "source_STORE.zip",
+)
+
+modes = (
+    "w",
+    "w:",
+    "w:gz",
+    "w:bz2",
+    "w:xz",
+    "x",
+    "x:",
+    "x:gz",
+    "x:bz2",
+    "x:xz",
+    "a",
+    "a:",
+)
+
+# Every extension an archive can be written with
+extensions = ("zip", "cbz") + ("tar", "tar.bz2", "tar.gz", "tar.xz", "cbt") + ("7z", "cb7")
+
+
+def has_rar_tool() -> bool:
+    """Whether rarfile found an external tool, which it needs for anything but stored RAR members."""
+    try:
+        rarfile.tool_setup()
+    except rarfile.RarCannotExec:
+        return False
+    return True
+
+
+# Archives that can always be listed, but whose members need more than the standard library to be decompressed
+decompression_marks = {
+    "source_BEST.rar": pytest.mark.skipif(not has_rar_tool(), reason="Needs unrar, unar, 7z or bsdtar"),
+    "source_DEFLATE64.zip": pytest.mark.xfail(
+        raises=NotImplementedError, strict=True, reason="Deflate64 is not supported by ZipFile"
+    ),
+    "source_PPMD.zip": pytest.mark.xfail(
+        raises=NotImplementedError, strict=True, reason="PPMd is not supported by ZipFile"
+    ),
+}
+
+# Alias the pre-configured parametrize functions for reusability
+parametrize_files = pytest.mark.parametrize("file", files, ids=lambda x: x.name)
+parametrize_files_to_read = pytest.mark.parametrize(
+    "file", [pytest.param(file, marks=decompression_marks.get(file.name, ()), id=file.name) for file in files]
+)
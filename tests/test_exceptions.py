@@ -1,57 +1,16 @@
 from __future__ import annotations
 
+from itertools import cycle
 from pathlib import Path
 
 import pytest
 from archivefile import ArchiveFile
 
-modes = (
-    "w",
-    "w:",
-    "w:gz",
-    "w:bz2",
-    "w:xz",
-    "x:",
-    "x:",
-    "x:gz",
-    "x:bz2",
-    "x:xz",
-    "a",
-    "a:",
-)
-
-extensions = ("zip", "cbz") + ("tar", "tar.bz2", "tar.gz", "tar.xz", "cbt") + ("7z", "cb7")
-
-files = (
-    Path("tests/test_data/source_BEST.rar"),
-    Path("tests/test_data/source_BZIP2.7z"),
-    Path("tests/test_data/source_BZIP2.zip"),
-    Path("tests/test_data/source_DEFLATE.zip"),
-    Path("tests/test_data/source_DEFLATE64.zip"),  # Deflate64 is not supported by ZipFile
-    Path("tests/test_data/source_GNU.tar"),
-    Path("tests/test_data/source_GNU.tar.bz2"),
-    Path("tests/test_data/source_GNU.tar.gz"),
-    Path("tests/test_data/source_GNU.tar.xz"),
-    Path("tests/test_data/source_LZMA.7z"),
-    Path("tests/test_data/source_LZMA.zip"),
-    Path("tests/test_data/source_LZMA2.7z"),
-    Path("tests/test_data/source_POSIX.tar"),
-    Path("tests/test_data/source_POSIX.tar.bz2"),
-    Path("tests/test_data/source_POSIX.tar.gz"),
-    Path("tests/test_data/source_POSIX.tar.xz"),
-    Path("tests/test_data/source_PPMD.7z"),
-    Path("tests/test_data/source_PPMD.zip"),  # PPMd is not supported by ZipFile
-    Path("tests/test_data/source_STORE.7z"),
-    Path("tests/test_data/source_LZMA_SOLID.7z"),
-    Path("tests/test_data/source_LZMA2_SOLID.7z"),
-    Path("tests/test_data/source_PPMD_SOLID.7z"),
-    Path("tests/test_data/source_BZIP2_SOLID.7z"),
-    Path("tests/test_data/source_STORE.rar"),
-    Path("tests/test_data/source_STORE.zip"),
-)
-
-# Alias the pre-configured parametrize function for reusability
-parametrize_files = pytest.mark.parametrize("file", files, ids=lambda x: x.name)
+from tests.conftest import TEST_DATA, extensions, modes, parametrize_files
+
+# The argument checks don't depend on the mode, so each mode and each extension
+# only has to show up once rather than in every combination.
+modes_and_extensions = tuple(zip(modes, cycle(extensions)))
 
 
 def test_write_rar() -> None:
@@ -60,7 +19,7 @@ def test_write_rar() -> None:
             archive.read_text("somefile.txt")
 
     with pytest.raises(NotImplementedError):
-        with ArchiveFile("tests/test_data/source_BEST.rar", "w") as archive:
+        with ArchiveFile(TEST_DATA / "source_BEST.rar", "w") as archive:
             archive.print_tree()
 
 
@@ -96,29 +55,14 @@ def test_existing_unsupported_archive(tmp_path: Path) -> None:
 
 @parametrize_files
 def test_missing_member(file: Path) -> None:
-    with pytest.raises(KeyError):
-        with ArchiveFile(file) as archive:
+    with ArchiveFile(file) as archive:
+        with pytest.raises(KeyError):
             archive.get_member("non-existent.member")
-
-
-@parametrize_files
-def test_missing_member_in_read_bytes(file: Path) -> None:
-    with pytest.raises(KeyError):
-        with ArchiveFile(file) as archive:
+        with pytest.raises(KeyError):
             archive.read_bytes("non-existent.member")
-
-
-@parametrize_files
-def test_missing_member_in_read_text(file: Path) -> None:
-    with pytest.raises(KeyError):
-        with ArchiveFile(file) as archive:
+        with pytest.raises(KeyError):
             archive.read_text("non-existent.member")
-
-
-@parametrize_files
-def test_missing_member_in_extract(file: Path) -> None:
-    with pytest.raises(KeyError):
-        with ArchiveFile(file) as archive:
+        with pytest.raises(KeyError):
             archive.extract("non-existent.member")
 
 
@@ -129,8 +73,7 @@ def test_missing_member_in_extractall(file: Path, tmp_path: Path) -> None:
             archive.extractall(destination=tmp_path, members=["non-existent.member"])
 
 
-@pytest.mark.parametrize("extension", extensions)
-@pytest.mark.parametrize("mode", modes)
+@pytest.mark.parametrize(("mode", "extension"), modes_and_extensions)
 def test_write_not_a_file(tmp_path: Path, mode: str, extension: str) -> None:
     with pytest.raises(ValueError):
         archive_file = tmp_path / f"somefile.{extension}"
@@ -138,8 +81,7 @@ def test_write_not_a_file(tmp_path: Path, mode: str, extension: str) -> None:
             archive.write(tmp_path)
 
 
-@pytest.mark.parametrize("extension", extensions)
-@pytest.mark.parametrize("mode", modes)
+@pytest.mark.parametrize(("mode", "extension"), modes_and_extensions)
 def test_write_not_a_dir(tmp_path: Path, mode: str, extension: str) -> None:
     with pytest.raises(ValueError):
         archive_file = tmp_path / f"somefile.{extension}"
@@ -149,11 +91,42 @@ def test_write_not_a_dir(tmp_path: Path, mode: str, extension: str) -> None:
             archive.writeall(file)
 
 
-@pytest.mark.parametrize("extension", extensions)
-@pytest.mark.parametrize("mode", modes)
+@pytest.mark.parametrize(("mode", "extension"), modes_and_extensions)
 def test_writeall_not_dir(tmp_path: Path, mode: str, extension: str) -> None:
-    archive_dir = Path("src/archivefile").resolve()
+    archive_dir = Path(__file__).parent
     with pytest.raises(ValueError):
         dir = tmp_path / f"somefile.{extension}"
         with ArchiveFile(dir, mode) as archive:
             archive.writeall(archive_dir, root=tmp_path)
+
+
+@parametrize_files
+def test_missing_member_in_extractall_with_workers(file: Path, tmp_path: Path) -> None:
+    with pytest.raises(KeyError):
+        with ArchiveFile(file) as archive:
+            archive.extractall(destination=tmp_path, members=["non-existent.member"], workers=4)
+
+
+@parametrize_files
+def test_extractall_invalid_workers(file: Path, tmp_path: Path) -> None:
+    with ArchiveFile(file) as archive:
+        for workers in (0, -5):
+            with pytest.raises(ValueError):
+                archive.extractall(destination=tmp_path, workers=workers)
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("extension", ("zip", "tar", "7z"))
+def test_write_text_and_bytes_wrong_type(tmp_path: Path, extension: str) -> None:
+    with ArchiveFile(tmp_path / f"source.{extension}", "w") as archive:
+        with pytest.raises(TypeError):
+            archive.write_text(b"spam", arcname="spam.txt")  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            archive.write_bytes("eggs", arcname="eggs.txt")  # type: ignore[arg-type]
+
+
+@parametrize_files
+def test_member_wrong_type(file: Path) -> None:
+    with ArchiveFile(file) as archive:
+        with pytest.raises(TypeError):
+            archive.get_member(123)  # type: ignore[arg-type]
@@ -1,52 +1,49 @@
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
-from uuid import uuid4
 from zipfile import ZipFile
 
 import pytest
 from archivefile import ArchiveFile, ArchiveMember
 
-files = (
-    Path("tests/test_data/source_BEST.rar"),
-    Path("tests/test_data/source_BZIP2.7z"),
-    Path("tests/test_data/source_BZIP2.zip"),
-    Path("tests/test_data/source_DEFLATE.zip"),
-    # Path("tests/test_data/source_DEFLATE64.zip"), # Deflate64 is not supported by ZipFile
-    Path("tests/test_data/source_GNU.tar"),
-    Path("tests/test_data/source_GNU.tar.bz2"),
-    Path("tests/test_data/source_GNU.tar.gz"),
-    Path("tests/test_data/source_GNU.tar.xz"),
-    Path("tests/test_data/source_LZMA.7z"),
-    Path("tests/test_data/source_LZMA.zip"),
-    Path("tests/test_data/source_LZMA2.7z"),
-    Path("tests/test_data/source_POSIX.tar"),
-    Path("tests/test_data/source_POSIX.tar.bz2"),
-    Path("tests/test_data/source_POSIX.tar.gz"),
-    Path("tests/test_data/source_POSIX.tar.xz"),
-    Path("tests/test_data/source_PPMD.7z"),
-    # Path("tests/test_data/source_PPMD.zip"), # PPMd is not supported by ZipFile
-    Path("tests/test_data/source_STORE.7z"),
-    Path("tests/test_data/source_LZMA_SOLID.7z"),
-    Path("tests/test_data/source_LZMA2_SOLID.7z"),
-    Path("tests/test_data/source_PPMD_SOLID.7z"),
-    Path("tests/test_data/source_BZIP2_SOLID.7z"),
-    Path("tests/test_data/source_STORE.rar"),
-    Path("tests/test_data/source_STORE.zip"),
+from tests.conftest import TEST_DATA, parametrize_files_to_read
+
+EXPECTED = (
+    "pyanilist-main/.gitignore",
+    "pyanilist-main/.pre-commit-config.yaml",
+    "pyanilist-main/mkdocs.yml",
+    "pyanilist-main/poetry.lock",
+    "pyanilist-main/pyproject.toml",
+)
+
+# The same members as above, spelled in each of the forms extractall() accepts
+MEMBERS: tuple[str | Path | ArchiveMember, ...] = (
+    "pyanilist-main/.gitignore",
+    Path("pyanilist-main/.pre-commit-config.yaml"),
+    ArchiveMember(name="pyanilist-main/mkdocs.yml"),
+    "pyanilist-main/poetry.lock",
+    "pyanilist-main/pyproject.toml",
 )
 
-# Alias the pre-configured parametrize function for reusability
-parametrize_files = pytest.mark.parametrize("file", files, ids=lambda x: x.name)
+
+# Reference extraction that the extractall tests compare against, done once per session
+@pytest.fixture(scope="session")
+def control(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    dest = tmp_path_factory.mktemp("control")
+    with ZipFile(TEST_DATA / "source_STORE.zip") as archive:
+        archive.extractall(path=dest)
+    return dest
 
 
-@parametrize_files
+@parametrize_files_to_read
 def test_extract(file: Path, tmp_path: Path) -> None:
     with ArchiveFile(file) as archive:
         member = archive.extract("pyanilist-main/README.md", destination=tmp_path)
         assert member.is_file()
 
 
-@parametrize_files
+@parametrize_files_to_read
 def test_extract_without_context_manager(file: Path, tmp_path: Path) -> None:
     archive = ArchiveFile(file)
     extracted_file = archive.extract("pyanilist-main/README.md", destination=tmp_path)
@@ -54,47 +51,77 @@ def test_extract_without_context_manager(file: Path, tmp_path: Path) -> None:
     assert extracted_file.is_file()
 
 
-@parametrize_files
+@parametrize_files_to_read
+def test_extract_into_removed_destination(file: Path, tmp_path: Path) -> None:
+    with ArchiveFile(file) as archive:
+        archive.extract("pyanilist-main/README.md", destination=tmp_path / "dest")
+        shutil.rmtree(tmp_path / "dest")
+        assert archive.extract("pyanilist-main/README.md", destination=tmp_path / "dest").is_file()
+
+
+@parametrize_files_to_read
 def test_extract_by_member(file: Path, tmp_path: Path) -> None:
     with ArchiveFile(file) as archive:
-        member = [member for member in archive.get_members() if member.is_file][0]
+        member = next(member for member in archive.get_members() if member.is_file)
         outfile = archive.extract(member, destination=tmp_path)
         assert outfile.is_file()
 
 
-@parametrize_files
-def test_extractall(file: Path, tmp_path: Path) -> None:
-    with ZipFile("tests/test_data/source_STORE.zip") as archive:
-        dest = tmp_path / uuid4().hex
-        archive.extractall(path=dest)
-        control = tuple((dest / "pyanilist-main").rglob("*"))
-
+@parametrize_files_to_read
+def test_extractall(file: Path, tmp_path: Path, control: Path) -> None:
     with ArchiveFile(file) as archive:
-        dest2 = tmp_path / uuid4().hex
-        archive.extractall(destination=dest2)
-        members = tuple((dest / "pyanilist-main").rglob("*"))
-        assert control == members
+        dest = tmp_path / "dest"
+        archive.extractall(destination=dest)
+
+    expected = sorted(path.relative_to(control) for path in control.rglob("*"))
+    assert sorted(path.relative_to(dest) for path in dest.rglob("*")) == expected
 
 
-@parametrize_files
+@parametrize_files_to_read
 def test_extractall_by_members(file: Path, tmp_path: Path) -> None:
-    expected = [
-        "pyanilist-main/.gitignore",
-        "pyanilist-main/.pre-commit-config.yaml",
-        "pyanilist-main/mkdocs.yml",
-        "pyanilist-main/poetry.lock",
-        "pyanilist-main/pyproject.toml",
-    ]
-
-    members = [
-        "pyanilist-main/.gitignore",
-        Path("pyanilist-main/.pre-commit-config.yaml"),
-        ArchiveMember(name="pyanilist-main/mkdocs.yml"),
-        "pyanilist-main/poetry.lock",
-        "pyanilist-main/pyproject.toml",
-    ]
+    with ArchiveFile(file) as archive:
+        folder = archive.extractall(destination=tmp_path, members=MEMBERS) / "pyanilist-main"
+        assert len(MEMBERS) == len(tuple(folder.rglob("*"))) == 5
+        assert frozenset(EXPECTED) == frozenset(member.relative_to(tmp_path).as_posix() for member in folder.rglob("*"))
+
 
+@parametrize_files_to_read
+def test_extractall_with_workers(file: Path, tmp_path: Path, control: Path) -> None:
     with ArchiveFile(file) as archive:
-        folder = archive.extractall(destination=tmp_path, members=members) / "pyanilist-main"  # type: ignore
-        assert len(members) == len(tuple(folder.rglob("*"))) == 5
-        assert sorted(expected) == sorted([member.relative_to(tmp_path).as_posix() for member in folder.rglob("*")])
+        destination = archive.extractall(destination=tmp_path / "workers", workers=4)
+
+    expected = sorted(path.relative_to(control) for path in control.rglob("*"))
+    assert sorted(path.relative_to(destination) for path in destination.rglob("*")) == expected
+    assert (destination / "pyanilist-main/README.md").read_bytes() == (
+        control / "pyanilist-main/README.md"
+    ).read_bytes()
+
+
+def test_extractall_with_more_workers_than_members(tmp_path: Path) -> None:
+    with ArchiveFile(TEST_DATA / "source_STORE.zip") as archive:
+        destination = archive.extractall(destination=tmp_path / "workers", members=EXPECTED[:2], workers=64)
+
+    files = sorted(path.relative_to(destination).as_posix() for path in destination.rglob("*") if path.is_file())
+    assert files == list(EXPECTED[:2])
+
+    empty = tmp_path / "empty.zip"
+    ZipFile(empty, "w").close()
+    with ArchiveFile(empty) as archive:
+        assert archive.extractall(destination=tmp_path / "empty", workers=4) == tmp_path / "empty"
+
+
+def test_extractall_with_workers_keeps_kwargs(tmp_path: Path) -> None:
+    # ZipFile always flags non-ASCII names as UTF-8, so write a placeholder and swap in the cp1251 bytes afterwards
+    file = tmp_path / "cp1251.zip"
+    with ZipFile(file, "w") as archive:
+        archive.writestr("PLACEH.txt", "hello")
+        archive.writestr("other.txt", "world")
+    file.write_bytes(file.read_bytes().replace(b"PLACEH.txt", "привет.txt".encode("cp1251")))
+
+    with ArchiveFile(file, metadata_encoding="cp1251") as archive:
+        destination = archive.extractall(
+            destination=tmp_path / "workers", members=["привет.txt", "привет.txt", "other.txt"], workers=2
+        )
+
+    assert (destination / "привет.txt").read_text() == "hello"
+    assert (destination / "other.txt").read_text() == "world"
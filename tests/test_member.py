@@ -1,534 +1,140 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
 
+import py7zr
 import pytest
 from archivefile import ArchiveFile
 
-files = (
-    Path("tests/test_data/source_BEST.rar"),
-    Path("tests/test_data/source_BZIP2.7z"),
-    Path("tests/test_data/source_BZIP2.zip"),
-    Path("tests/test_data/source_DEFLATE.zip"),
-    Path("tests/test_data/source_DEFLATE64.zip"),
-    Path("tests/test_data/source_GNU.tar"),
-    Path("tests/test_data/source_GNU.tar.bz2"),
-    Path("tests/test_data/source_GNU.tar.gz"),
-    Path("tests/test_data/source_GNU.tar.xz"),
-    Path("tests/test_data/source_LZMA.7z"),
-    Path("tests/test_data/source_LZMA.zip"),
-    Path("tests/test_data/source_LZMA2.7z"),
-    Path("tests/test_data/source_POSIX.tar"),
-    Path("tests/test_data/source_POSIX.tar.bz2"),
-    Path("tests/test_data/source_POSIX.tar.gz"),
-    Path("tests/test_data/source_POSIX.tar.xz"),
-    Path("tests/test_data/source_PPMD.7z"),
-    Path("tests/test_data/source_PPMD.zip"),
-    Path("tests/test_data/source_STORE.7z"),
-    Path("tests/test_data/source_LZMA_SOLID.7z"),
-    Path("tests/test_data/source_LZMA2_SOLID.7z"),
-    Path("tests/test_data/source_PPMD_SOLID.7z"),
-    Path("tests/test_data/source_BZIP2_SOLID.7z"),
-    Path("tests/test_data/source_STORE.rar"),
-    Path("tests/test_data/source_STORE.zip"),
-)
-
-# Alias the pre-configured parametrize function for reusability
-parametrize_files = pytest.mark.parametrize("file", files, ids=lambda x: x.name)
+from tests.conftest import TEST_DATA, parametrize_files
 
 
 @parametrize_files
-def test_get_members(file: Path) -> None:
+def test_get_members_and_names(file: Path) -> None:
     with ArchiveFile(file) as archive:
-        assert len(tuple(archive.get_members())) == 53
-
-
-@parametrize_files
-def test_get_members_without_context_manager(file: Path) -> None:
-    archive = ArchiveFile(file)
-    total_members = len(tuple(archive.get_members()))
-    archive.close()
-    assert total_members == 53
-
-
-@parametrize_files
-def test_get_names(file: Path) -> None:
-    with ArchiveFile(file) as archive:
-        assert len(archive.get_names()) == 53
-
-
-@parametrize_files
-def test_get_names_without_context_manager(file: Path) -> None:
-    archive = ArchiveFile(file)
-    total_members = len(archive.get_names())
-    archive.close()
-    assert total_members == 53
-
-
-@parametrize_files
-def test_member_and_names(file: Path) -> None:
-    with ArchiveFile(file) as archive:
-        names = tuple([member.name for member in archive.get_members()])
+        names = tuple(map(attrgetter("name"), archive.get_members()))
+        assert len(names) == 53
         assert archive.get_names() == names
 
 
 @parametrize_files
-def test_members_and_names_without_context_manager(file: Path) -> None:
+def test_get_members_and_names_without_context_manager(file: Path) -> None:
     archive = ArchiveFile(file)
-    names = tuple([member.name for member in archive.get_members()])
+    names = tuple(map(attrgetter("name"), archive.get_members()))
     assert archive.get_names() == names
     archive.close()
-
-
-def test_get_member_files() -> None:
-    with ArchiveFile("tests/test_data/source_BEST.rar") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 1224
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_BZIP2.7z") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_BZIP2.zip") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 1336
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_BZIP2_SOLID.7z") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_DEFLATE.zip") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 1168
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_DEFLATE64.zip") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 1170
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_GNU.tar") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 5251
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_GNU.tar.bz2") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 5251
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_GNU.tar.gz") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 5251
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_GNU.tar.xz") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 5251
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_LZMA.7z") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_LZMA.zip") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 1230
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_LZMA2.7z") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_LZMA2_SOLID.7z") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_LZMA_SOLID.7z") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_POSIX.tar") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 5251
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_POSIX.tar.bz2") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 5251
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_POSIX.tar.gz") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 5251
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_POSIX.tar.xz") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 5251
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_PPMD.7z") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_PPMD.zip") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 1103
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_PPMD_SOLID.7z") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_STORE.7z") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_STORE.rar") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-    with ArchiveFile("tests/test_data/source_STORE.zip") as archive:
-        member = archive.get_member("pyanilist-main/README.md")
-        assert member.name == "pyanilist-main/README.md"
-        assert member.size == 3799
-        assert member.compressed_size == 3799
-        assert member.checksum == 398102207
-        assert member.is_dir is False
-        assert member.is_file is True
-
-
-def test_get_member_dirs() -> None:
-    with ArchiveFile("tests/test_data/source_BEST.rar") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs/"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
-
-    with ArchiveFile("tests/test_data/source_BZIP2.7z") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
-
-    with ArchiveFile("tests/test_data/source_BZIP2.zip") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs/"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
-
-    with ArchiveFile("tests/test_data/source_BZIP2_SOLID.7z") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
-
-    with ArchiveFile("tests/test_data/source_DEFLATE.zip") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs/"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
-
-    with ArchiveFile("tests/test_data/source_DEFLATE64.zip") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs/"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
-
-    with ArchiveFile("tests/test_data/source_GNU.tar") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 5024
-        assert member.is_dir is True
-        assert member.is_file is False
-
-    with ArchiveFile("tests/test_data/source_GNU.tar.bz2") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 5024
-        assert member.is_dir is True
-        assert member.is_file is False
-
-    with ArchiveFile("tests/test_data/source_GNU.tar.gz") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 5024
-        assert member.is_dir is True
-        assert member.is_file is False
-
-    with ArchiveFile("tests/test_data/source_GNU.tar.xz") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 5024
-        assert member.is_dir is True
-        assert member.is_file is False
-
-    with ArchiveFile("tests/test_data/source_LZMA.7z") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
-
-    with ArchiveFile("tests/test_data/source_LZMA.zip") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs/"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
-
-    with ArchiveFile("tests/test_data/source_LZMA2.7z") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
-
-    with ArchiveFile("tests/test_data/source_LZMA2_SOLID.7z") as archive:
+    assert len(names) == 53
+
+
+@pytest.mark.parametrize(
+    ("file", "compressed_size", "checksum"),
+    [
+        ("source_BEST.rar", 1224, 398102207),
+        ("source_BZIP2.7z", 3799, 398102207),
+        ("source_BZIP2.zip", 1336, 398102207),
+        ("source_BZIP2_SOLID.7z", 3799, 398102207),
+        ("source_DEFLATE.zip", 1168, 398102207),
+        ("source_DEFLATE64.zip", 1170, 398102207),
+        ("source_GNU.tar", 3799, 5251),
+        ("source_GNU.tar.bz2", 3799, 5251),
+        ("source_GNU.tar.gz", 3799, 5251),
+        ("source_GNU.tar.xz", 3799, 5251),
+        ("source_LZMA.7z", 3799, 398102207),
+        ("source_LZMA.zip", 1230, 398102207),
+        ("source_LZMA2.7z", 3799, 398102207),
+        ("source_LZMA2_SOLID.7z", 3799, 398102207),
+        ("source_LZMA_SOLID.7z", 3799, 398102207),
+        ("source_POSIX.tar", 3799, 5251),
+        ("source_POSIX.tar.bz2", 3799, 5251),
+        ("source_POSIX.tar.gz", 3799, 5251),
+        ("source_POSIX.tar.xz", 3799, 5251),
+        ("source_PPMD.7z", 3799, 398102207),
+        ("source_PPMD.zip", 1103, 398102207),
+        ("source_PPMD_SOLID.7z", 3799, 398102207),
+        ("source_STORE.7z", 3799, 398102207),
+        ("source_STORE.rar", 3799, 398102207),
+        ("source_STORE.zip", 3799, 398102207),
+    ],
+)
+def test_get_member_files(file: str, compressed_size: int, checksum: int) -> None:
+    with ArchiveFile(TEST_DATA / file) as archive:
+        member = archive.get_member("pyanilist-main/README.md")
+        actual = (member.name, member.size, member.compressed_size, member.checksum, member.is_dir, member.is_file)
+        assert actual == ("pyanilist-main/README.md", 3799, compressed_size, checksum, False, True)
+
+
+@pytest.mark.parametrize(
+    ("file", "name", "checksum"),
+    [
+        ("source_BEST.rar", "pyanilist-main/docs/", 0),
+        ("source_BZIP2.7z", "pyanilist-main/docs", 0),
+        ("source_BZIP2.zip", "pyanilist-main/docs/", 0),
+        ("source_BZIP2_SOLID.7z", "pyanilist-main/docs", 0),
+        ("source_DEFLATE.zip", "pyanilist-main/docs/", 0),
+        ("source_DEFLATE64.zip", "pyanilist-main/docs/", 0),
+        ("source_GNU.tar", "pyanilist-main/docs", 5024),
+        ("source_GNU.tar.bz2", "pyanilist-main/docs", 5024),
+        ("source_GNU.tar.gz", "pyanilist-main/docs", 5024),
+        ("source_GNU.tar.xz", "pyanilist-main/docs", 5024),
+        ("source_LZMA.7z", "pyanilist-main/docs", 0),
+        ("source_LZMA.zip", "pyanilist-main/docs/", 0),
+        ("source_LZMA2.7z", "pyanilist-main/docs", 0),
+        ("source_LZMA2_SOLID.7z", "pyanilist-main/docs", 0),
+        ("source_LZMA_SOLID.7z", "pyanilist-main/docs", 0),
+        ("source_POSIX.tar", "pyanilist-main/docs", 5024),
+        ("source_POSIX.tar.bz2", "pyanilist-main/docs", 5024),
+        ("source_POSIX.tar.gz", "pyanilist-main/docs", 5024),
+        ("source_POSIX.tar.xz", "pyanilist-main/docs", 5024),
+        ("source_PPMD.7z", "pyanilist-main/docs", 0),
+        ("source_PPMD.zip", "pyanilist-main/docs/", 0),
+        ("source_PPMD_SOLID.7z", "pyanilist-main/docs", 0),
+        ("source_STORE.7z", "pyanilist-main/docs", 0),
+        ("source_STORE.rar", "pyanilist-main/docs/", 0),
+        ("source_STORE.zip", "pyanilist-main/docs/", 0),
+    ],
+)
+def test_get_member_dirs(file: str, name: str, checksum: int) -> None:
+    with ArchiveFile(TEST_DATA / file) as archive:
         member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
+        actual = (member.name, member.size, member.compressed_size, member.checksum, member.is_dir, member.is_file)
+        assert actual == (name, 0, 0, checksum, True, False)
 
-    with ArchiveFile("tests/test_data/source_LZMA_SOLID.7z") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
 
-    with ArchiveFile("tests/test_data/source_POSIX.tar") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 5024
-        assert member.is_dir is True
-        assert member.is_file is False
+def test_get_member_after_append(tmp_path: Path) -> None:
+    file = tmp_path / "source.7z"
+    file.write_bytes((TEST_DATA / "source_LZMA.7z").read_bytes())
 
-    with ArchiveFile("tests/test_data/source_POSIX.tar.bz2") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 5024
-        assert member.is_dir is True
-        assert member.is_file is False
-
-    with ArchiveFile("tests/test_data/source_POSIX.tar.gz") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 5024
-        assert member.is_dir is True
-        assert member.is_file is False
+    with ArchiveFile(file, "a") as archive:
+        assert archive.get_member("pyanilist-main/README.md").is_file
+        archive.write_text("spam", arcname="eggs.txt")
+        assert archive.get_member("eggs.txt").name == "eggs.txt"
 
-    with ArchiveFile("tests/test_data/source_POSIX.tar.xz") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 5024
-        assert member.is_dir is True
-        assert member.is_file is False
 
-    with ArchiveFile("tests/test_data/source_PPMD.7z") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
+@pytest.mark.parametrize("extension", ("zip", "tar", "7z"))
+def test_get_names_while_writing(tmp_path: Path, extension: str) -> None:
+    with ArchiveFile(tmp_path / f"source.{extension}", "w") as archive:
+        archive.write_text("spam", arcname="spam.txt")
+        assert archive.get_names() == ("spam.txt",)
+        archive.write_text("eggs", arcname="eggs.txt")
+        assert archive.get_names() == ("spam.txt", "eggs.txt")
 
-    with ArchiveFile("tests/test_data/source_PPMD.zip") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs/"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
 
-    with ArchiveFile("tests/test_data/source_PPMD_SOLID.7z") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
+def test_sevenzip_member_without_timestamp(monkeypatch: pytest.MonkeyPatch) -> None:
+    # py7zr reports members without a stored timestamp with `creationtime=None`
+    list_members = py7zr.SevenZipFile.list
 
-    with ArchiveFile("tests/test_data/source_STORE.7z") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
+    def without_timestamp(self: py7zr.SevenZipFile) -> list[py7zr.FileInfo]:
+        members = list_members(self)
+        for member in members:
+            member.creationtime = None
+        return members
 
-    with ArchiveFile("tests/test_data/source_STORE.rar") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs/"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
+    monkeypatch.setattr(py7zr.SevenZipFile, "list", without_timestamp)
 
-    with ArchiveFile("tests/test_data/source_STORE.zip") as archive:
-        member = archive.get_member("pyanilist-main/docs/")
-        assert member.name == "pyanilist-main/docs/"
-        assert member.size == 0
-        assert member.compressed_size == 0
-        assert member.checksum == 0
-        assert member.is_dir is True
-        assert member.is_file is False
+    with ArchiveFile(TEST_DATA / "source_LZMA.7z") as archive:
+        # Same timezone as members with a timestamp, so they can be compared and sorted together
+        expected = datetime.min.replace(tzinfo=timezone.utc)
+        assert archive.get_member("pyanilist-main/README.md").datetime == expected
+        assert {member.datetime for member in archive.get_members()} == {expected}
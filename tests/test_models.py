@@ -1,9 +1,33 @@
 from __future__ import annotations
 
-from archivefile import ArchiveMember
+from pathlib import Path
+
+import pytest
+from archivefile import ArchiveFile, ArchiveMember
+
+from tests.conftest import TEST_DATA
 
 
 def test__str__() -> None:
     assert ArchiveMember(name="src/main/").name == str(ArchiveMember(name="src/main/"))
     assert ArchiveMember(name="src/main").name == str(ArchiveMember(name="src/main"))
     assert ArchiveMember(name="src/main.py").name == str(ArchiveMember(name="src/main.py"))
+
+
+@pytest.mark.parametrize(
+    "file",
+    [
+        TEST_DATA / "source_GNU.tar",
+        TEST_DATA / "source_LZMA.7z",
+        TEST_DATA / "source_STORE.rar",
+        TEST_DATA / "source_STORE.zip",
+    ],
+    ids=lambda x: x.name,
+)
+def test_members_match_validated_model(file: Path) -> None:
+    # Adapters build members with `model_construct`, skipping validation.
+    # Make sure the result is still identical to a fully validated model.
+    with ArchiveFile(file) as archive:
+        for member in archive.get_members():
+            assert member == ArchiveMember.model_validate(member.model_dump())
+            assert type(member.size) is type(ArchiveMember.model_validate(member.model_dump()).size)
@@ -3,6 +3,8 @@ from __future__ import annotations
 from archivefile import ArchiveFile
 from pytest import CaptureFixture
 
+from tests.conftest import TEST_DATA
+
 table = """
 | Name                                              | Date modified             | Type   | Size     | Compressed Size |
 |---------------------------------------------------|---------------------------|--------|----------|-----------------|
@@ -59,14 +61,14 @@ table = """
 | pyanilist-main/tests/test_exceptions.py           | 2024-04-10T20:10:57+00:00 | File   | 554B     | 554B            |
 | pyanilist-main/tests/test_models.py               | 2024-04-10T20:10:57+00:00 | File   | 306B     | 306B            |
 | pyanilist-main/tests/test_utils.py                | 2024-04-10T20:10:57+00:00 | File   | 4.1KiB   | 4.1KiB          |
-"""
+""".strip()
 
 
 def test_print_table(capsys: CaptureFixture[str]) -> None:
-    with ArchiveFile("tests/test_data/source_GNU.tar") as archive:
+    with ArchiveFile(TEST_DATA / "source_GNU.tar") as archive:
         archive.print_table()
-        assert len(capsys.readouterr().out.strip().splitlines()) == len(table.strip().splitlines()) + 2
+        assert len(capsys.readouterr().out.strip().splitlines()) == len(table.splitlines()) + 2
 
-    with ArchiveFile("tests/test_data/source_GNU.tar") as archive:
+    with ArchiveFile(TEST_DATA / "source_GNU.tar") as archive:
         archive.print_table(title="")
-        assert len(capsys.readouterr().out.strip().splitlines()) == len(table.strip().splitlines())
+        assert len(capsys.readouterr().out.strip().splitlines()) == len(table.splitlines())
@@ -3,6 +3,8 @@ from __future__ import annotations
 from archivefile import ArchiveFile
 from pytest import CaptureFixture
 
+from tests.conftest import TEST_DATA
+
 tree = """
 source_GNU.tar
 └── pyanilist-main
@@ -62,6 +64,32 @@ source_GNU.tar
 
 
 def test_print_tree(capsys: CaptureFixture[str]) -> None:
-    with ArchiveFile("tests/test_data/source_GNU.tar") as archive:
+    with ArchiveFile(TEST_DATA / "source_GNU.tar") as archive:
         archive.print_tree()
-        assert capsys.readouterr().out.strip() == tree.strip()
+        assert capsys.readouterr().out.strip() == tree
+
+
+shallow_tree = """
+source_GNU.tar
+└── pyanilist-main
+    ├── .github
+    ├── .gitignore
+    ├── .pre-commit-config.yaml
+    ├── docs
+    ├── mkdocs.yml
+    ├── poetry.lock
+    ├── pyproject.toml
+    ├── README.md
+    ├── src
+    ├── tests
+    └── UNLICENSE
+""".strip()
+
+
+def test_print_tree_max_depth(capsys: CaptureFixture[str]) -> None:
+    with ArchiveFile(TEST_DATA / "source_GNU.tar") as archive:
+        archive.print_tree(max_depth=3)
+        assert capsys.readouterr().out.strip() == shallow_tree
+
+        archive.print_tree(max_depth=1)
+        assert capsys.readouterr().out.strip() == "source_GNU.tar"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import weakref
 from pathlib import Path
 
 import pytest
@@ -9,14 +10,16 @@ from archivefile._adapters._sevenzip import SevenZipFileAdapter
 from archivefile._adapters._tar import TarFileAdapter
 from archivefile._adapters._zip import ZipFileAdapter
 
+from tests.conftest import TEST_DATA
+
 
 @pytest.mark.parametrize(
     "file,compression_type,compression_level,adapter",
     [
-        (Path("tests/test_data/source_GNU.tar"), None, None, "TarFileAdapter"),
-        (Path("tests/test_data/source_STORE.7z"), None, None, "SevenZipFileAdapter"),
-        (Path("tests/test_data/source_STORE.rar"), None, None, "RarFileAdapter"),
-        (Path("tests/test_data/source_STORE.zip"), CompressionType.STORED, None, "ZipFileAdapter"),
+        (TEST_DATA / "source_GNU.tar", None, None, "TarFileAdapter"),
+        (TEST_DATA / "source_STORE.7z", None, None, "SevenZipFileAdapter"),
+        (TEST_DATA / "source_STORE.rar", None, None, "RarFileAdapter"),
+        (TEST_DATA / "source_STORE.zip", CompressionType.STORED, None, "ZipFileAdapter"),
     ],
     ids=lambda x: x.name if isinstance(x, Path) else x,  # https://github.com/pytest-dev/pytest/issues/8283
 )
@@ -32,10 +35,45 @@ def test_core_properties(
         assert archive.adapter == adapter
 
 
+@pytest.mark.parametrize(
+    "file,adapter",
+    [
+        (TEST_DATA / "source_GNU.tar", "TarFileAdapter"),
+        (TEST_DATA / "source_POSIX.tar", "TarFileAdapter"),
+        (TEST_DATA / "source_POSIX.tar.gz", "TarFileAdapter"),
+        (TEST_DATA / "source_STORE.7z", "SevenZipFileAdapter"),
+        (TEST_DATA / "source_STORE.rar", "RarFileAdapter"),
+        (TEST_DATA / "source_STORE.zip", "ZipFileAdapter"),
+    ],
+    ids=lambda x: x.name if isinstance(x, Path) else x,
+)
+def test_adapter_is_picked_by_content(tmp_path: Path, file: Path, adapter: str) -> None:
+    renamed = tmp_path / "archive.bin"
+    renamed.write_bytes(file.read_bytes())
+    with ArchiveFile(renamed) as archive:
+        assert archive.adapter == adapter
+
+
+@pytest.mark.parametrize(
+    "name,adapter",
+    [
+        ("archive.ZIP", "ZipFileAdapter"),
+        ("archive.v1.cbz", "ZipFileAdapter"),
+        ("archive.TAR.GZ", "TarFileAdapter"),
+        ("archive.backup.tar.xz", "TarFileAdapter"),
+        (".cbt", "TarFileAdapter"),
+        ("archive.7z", "SevenZipFileAdapter"),
+    ],
+)
+def test_adapter_is_picked_by_extension(tmp_path: Path, name: str, adapter: str) -> None:
+    with ArchiveFile(tmp_path / name, "w") as archive:
+        assert archive.adapter == adapter
+
+
 def test_rar_handler_properties() -> None:
-    file = "tests/test_data/source_STORE.rar"
+    file = TEST_DATA / "source_STORE.rar"
     with RarFileAdapter(file) as archive:
-        assert archive.file == Path(file).resolve()
+        assert archive.file == file.resolve()
         assert archive.mode == "r"
         assert archive.password is None
         assert archive.compression_type is None
@@ -44,9 +82,9 @@ def test_rar_handler_properties() -> None:
 
 
 def test_zip_handler_properties() -> None:
-    file = "tests/test_data/source_STORE.zip"
+    file = TEST_DATA / "source_STORE.zip"
     with ZipFileAdapter(file) as archive:
-        assert archive.file == Path(file).resolve()
+        assert archive.file == file.resolve()
         assert archive.mode == "r"
         assert archive.password is None
         assert archive.compression_type is CompressionType.STORED
@@ -55,9 +93,9 @@ def test_zip_handler_properties() -> None:
 
 
 def test_tar_handler_properties() -> None:
-    file = "tests/test_data/source_GNU.tar"
+    file = TEST_DATA / "source_GNU.tar"
     with TarFileAdapter(file) as archive:
-        assert archive.file == Path(file).resolve()
+        assert archive.file == file.resolve()
         assert archive.mode == "r"
         assert archive.password is None
         assert archive.compression_type is None
@@ -66,11 +104,16 @@ def test_tar_handler_properties() -> None:
 
 
 def test_sevenzip_handler_properties() -> None:
-    file = "tests/test_data/source_LZMA.7z"
+    file = TEST_DATA / "source_LZMA.7z"
     with SevenZipFileAdapter(file) as archive:
-        assert archive.file == Path(file).resolve()
+        assert archive.file == file.resolve()
         assert archive.mode == "r"
         assert archive.password is None
         assert archive.compression_type is None
         assert archive.compression_level is None
         assert archive.adapter == "SevenZipFileAdapter"
+
+
+def test_weakref() -> None:
+    with ArchiveFile(TEST_DATA / "source_STORE.zip") as archive:
+        assert weakref.ref(archive)() is archive
@@ -2,36 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import pytest
 from archivefile import ArchiveFile
 
-files = (
-    Path("tests/test_data/source_BEST.rar"),
-    Path("tests/test_data/source_BZIP2.7z"),
-    Path("tests/test_data/source_BZIP2.zip"),
-    Path("tests/test_data/source_DEFLATE.zip"),
-    # Path("tests/test_data/source_DEFLATE64.zip"), # Deflate64 is not supported by ZipFile
-    Path("tests/test_data/source_GNU.tar"),
-    Path("tests/test_data/source_GNU.tar.bz2"),
-    Path("tests/test_data/source_GNU.tar.gz"),
-    Path("tests/test_data/source_GNU.tar.xz"),
-    Path("tests/test_data/source_LZMA.7z"),
-    Path("tests/test_data/source_LZMA.zip"),
-    Path("tests/test_data/source_LZMA2.7z"),
-    Path("tests/test_data/source_POSIX.tar"),
-    Path("tests/test_data/source_POSIX.tar.bz2"),
-    Path("tests/test_data/source_POSIX.tar.gz"),
-    Path("tests/test_data/source_POSIX.tar.xz"),
-    Path("tests/test_data/source_PPMD.7z"),
-    # Path("tests/test_data/source_PPMD.zip"), # PPMd is not supported by ZipFile
-    Path("tests/test_data/source_STORE.7z"),
-    Path("tests/test_data/source_LZMA_SOLID.7z"),
-    Path("tests/test_data/source_LZMA2_SOLID.7z"),
-    Path("tests/test_data/source_PPMD_SOLID.7z"),
-    Path("tests/test_data/source_BZIP2_SOLID.7z"),
-    Path("tests/test_data/source_STORE.rar"),
-    Path("tests/test_data/source_STORE.zip"),
-)
+from tests.conftest import parametrize_files, parametrize_files_to_read
 
 unlicense = """\
 This is free and unencumbered software released into the public domain.
@@ -58,24 +31,21 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
-"""
+""".strip()
 
-# Alias the pre-configured parametrize function for reusability
-parametrize_files = pytest.mark.parametrize("file", files, ids=lambda x: x.name)
 
-
-@parametrize_files
+@parametrize_files_to_read
 def test_read_text_file(file: Path) -> None:
     with ArchiveFile(file) as archive:
         member = archive.read_text("pyanilist-main/UNLICENSE")
-        assert member.strip() == unlicense.strip()
+        assert member.strip() == unlicense
 
 
-@parametrize_files
+@parametrize_files_to_read
 def test_read_bytes_file(file: Path) -> None:
     with ArchiveFile(file) as archive:
         member = archive.read_bytes("pyanilist-main/UNLICENSE")
-        assert member.decode().strip() == unlicense.strip()
+        assert member.decode().strip() == unlicense
 
 
 @parametrize_files
@@ -1,14 +1,93 @@
 from __future__ import annotations
 
+from pathlib import Path
+from zipfile import ZipFile
+
 import pytest
-from archivefile._utils import clamp_compression_level, is_archive
+from archivefile._utils import (
+    abspath,
+    clamp_compression_level,
+    is_archive,
+    is_sevenzipfile,
+    iter_files,
+    realpath,
+    sniff_format,
+)
+
+from tests.conftest import TEST_DATA
+
+
+@pytest.mark.parametrize(
+    "file,expected",
+    [
+        (TEST_DATA / "source_BEST.rar", True),
+        (TEST_DATA / "source_PPMD.zip", True),
+        (Path(__file__), False),
+        (TEST_DATA / "non-existent-file.py", False),
+    ],
+    ids=lambda x: x.name if isinstance(x, Path) else None,
+)
+def test_is_archive(file: Path, expected: bool) -> None:
+    assert is_archive(file) is expected
+
+
+@pytest.mark.parametrize(
+    "file,expected",
+    [
+        (TEST_DATA / "source_STORE.zip", "zip"),
+        (TEST_DATA / "source_GNU.tar", "tar"),
+        (TEST_DATA / "source_POSIX.tar", "tar"),
+        (TEST_DATA / "source_POSIX.tar.gz", None),
+        (TEST_DATA / "source_STORE.7z", "7z"),
+        (TEST_DATA / "source_STORE.rar", "rar"),
+        (Path(__file__), None),
+    ],
+    ids=lambda x: x.name if isinstance(x, Path) else x,
+)
+def test_sniff_format(file: Path, expected: str | None) -> None:
+    assert sniff_format(file) == expected
+
+
+def test_is_archive_empty_zip(tmp_path: Path) -> None:
+    file = tmp_path / "empty.zip"
+    ZipFile(file, "w").close()
+    assert is_archive(file) is True
+    assert sniff_format(file) == "zip"
+
+
+def test_is_sevenzipfile() -> None:
+    assert is_sevenzipfile(TEST_DATA / "source_LZMA.7z") is True
+    assert is_sevenzipfile(TEST_DATA / "source_LZMA.zip") is False
+
+
+def test_realpath(tmp_path: Path) -> None:
+    (tmp_path / "real").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "real")
+    assert realpath(tmp_path / "link") == (tmp_path / "real").resolve()
+    assert realpath(tmp_path / ".." / tmp_path.name) == tmp_path.resolve()
+    assert realpath("tests/test_data") == Path("tests/test_data").resolve()
+    assert realpath("~") == Path.home().resolve()
+
+
+def test_abspath(tmp_path: Path) -> None:
+    (tmp_path / "real").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "real")
+    assert abspath(tmp_path / "link") == tmp_path / "link"
+    assert abspath(tmp_path / ".." / tmp_path.name) == tmp_path.resolve()
+    assert abspath("tests/test_data") == Path("tests/test_data").resolve()
+
 
+@pytest.mark.parametrize("glob", ("*", "*.py", "sub/*.py", "**/*.py"))
+@pytest.mark.parametrize("recursive", (True, False))
+def test_iter_files(tmp_path: Path, glob: str, recursive: bool) -> None:
+    for name in ("a.py", "b.txt", "sub/c.py", "sub/deeper/d.py", "sub/deeper/e.txt"):
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).touch()
+    (tmp_path / "dir.py").mkdir()
 
-def test_is_archive() -> None:
-    assert is_archive("tests/test_data/source_BEST.rar") is True
-    assert is_archive("tests/test_data/source_PPMD.zip") is True
-    assert is_archive("src/archivefile/__init__.py") is False
-    assert is_archive("non-existent-file.py") is False
+    files = tmp_path.rglob(glob) if recursive else tmp_path.glob(glob)
+    expected = sorted(str(file) for file in files if file.is_file())
+    assert sorted(iter_files(tmp_path, glob, recursive)) == expected
 
 
 @pytest.mark.parametrize(
@@ -1,158 +1,132 @@
 from __future__ import annotations
 
 from pathlib import Path
-from uuid import uuid4
 
 import pytest
 from archivefile import ArchiveFile, CompressionType
 
-modes = (
-    "w",
-    "w:",
-    "w:gz",
-    "w:bz2",
-    "w:xz",
-    "x:",
-    "x:",
-    "x:gz",
-    "x:bz2",
-    "x:xz",
-    "a",
-    "a:",
-)
+from tests.conftest import extensions, modes
 
-extensions = ("zip", "cbz") + ("tar", "tar.bz2", "tar.gz", "tar.xz", "cbt") + ("7z", "cb7")
+TEXT = "Hello World"
+
+
+# Every test archives the same file and only reads it, so it is written once per session
+@pytest.fixture(scope="session")
+def readme(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    file = tmp_path_factory.mktemp("source") / "README.md"
+    file.write_text(TEXT)
+    return file
 
 
 @pytest.mark.parametrize("extension", extensions)
 @pytest.mark.parametrize("mode", modes)
-def test_write_str(tmp_path: Path, mode: str, extension: str) -> None:
-    archive_file = tmp_path / f"{uuid4()}.{extension}"
-    file = tmp_path / "README.md"
-    file.touch()
-    text = "Hello World"
-    file.write_text(text)
+def test_write_str(tmp_path: Path, readme: Path, mode: str, extension: str) -> None:
+    archive_file = tmp_path / f"archive.{extension}"
 
     with ArchiveFile(archive_file, mode=mode) as archive:
-        archive.write(file)
+        archive.write(readme)
 
     with ArchiveFile(archive_file) as archive:
-        assert archive.read_text(file.name).strip() == text
+        assert archive.read_text(readme.name).strip() == TEXT
 
 
-@pytest.mark.parametrize("extension", extensions)
+@pytest.mark.parametrize("extension", ("zip", "cbz"))
 @pytest.mark.parametrize("mode", modes)
-def test_write_str_with_compression(tmp_path: Path, mode: str, extension: str) -> None:
-    archive_file = tmp_path / f"{uuid4()}.{extension}"
-    file = tmp_path / "README.md"
-    file.touch()
-    text = "Hello World"
-    file.write_text(text)
+def test_write_str_with_compression(tmp_path: Path, readme: Path, mode: str, extension: str) -> None:
+    archive_file = tmp_path / f"archive.{extension}"
 
     with ArchiveFile(archive_file, mode=mode, compression_level=0, compression_type=CompressionType.BZIP2) as archive:
-        archive.write(file)
+        archive.write(readme)
 
     with ArchiveFile(archive_file) as archive:
-        assert archive.read_text(file.name).strip() == text
+        assert archive.read_text(readme.name).strip() == TEXT
 
 
 @pytest.mark.parametrize("extension", ("zip", "cbz"))
 @pytest.mark.parametrize("mode", modes)
-def test_write_str_with_bzip2_compression(tmp_path: Path, mode: str, extension: str) -> None:
-    archive_file = tmp_path / f"{uuid4()}.{extension}"
-    file = tmp_path / "README.md"
-    file.touch()
-    text = "Hello World"
-    file.write_text(text)
+def test_write_str_with_bzip2_compression(tmp_path: Path, readme: Path, mode: str, extension: str) -> None:
+    archive_file = tmp_path / f"archive.{extension}"
 
     with ArchiveFile(archive_file, mode=mode, compression_level=0, compression_type=CompressionType.BZIP2) as archive:
         assert archive.compression_level == 1
-        archive.write(file)
+        archive.write(readme)
 
     with ArchiveFile(archive_file) as archive:
-        assert archive.read_text(file.name).strip() == text
+        assert archive.read_text(readme.name).strip() == TEXT
 
 
 @pytest.mark.parametrize("extension", extensions)
 @pytest.mark.parametrize("mode", modes)
-def test_write_zip_bytes(tmp_path: Path, mode: str, extension: str) -> None:
-    archive_file = tmp_path / f"{uuid4()}.{extension}"
-    file = tmp_path / "README.md"
-    file.touch()
-    text = b"Hello World"
-    file.write_bytes(text)
+def test_write_zip_bytes(tmp_path: Path, readme: Path, mode: str, extension: str) -> None:
+    archive_file = tmp_path / f"archive.{extension}"
 
     with ArchiveFile(archive_file, mode=mode) as archive:
-        archive.write(file)
+        archive.write(readme)
 
     with ArchiveFile(archive_file) as archive:
-        assert archive.read_bytes(file.name) == text
+        assert archive.read_bytes(readme.name) == TEXT.encode()
 
 
-@pytest.mark.parametrize("extension", extensions)
+@pytest.mark.parametrize("extension", ("zip", "cbz"))
 @pytest.mark.parametrize("mode", modes)
-def test_write_bytes_with_compression(tmp_path: Path, mode: str, extension: str) -> None:
-    archive_file = tmp_path / f"{uuid4()}.{extension}"
-    file = tmp_path / "README.md"
-    file.touch()
-    text = b"Hello World"
-    file.write_bytes(text)
+def test_write_bytes_with_compression(tmp_path: Path, readme: Path, mode: str, extension: str) -> None:
+    archive_file = tmp_path / f"archive.{extension}"
 
     with ArchiveFile(
         archive_file, mode=mode, compression_level=1, compression_type=CompressionType.DEFLATED
     ) as archive:
-        archive.write(file)
+        archive.write(readme)
+
+    with ArchiveFile(archive_file) as archive:
+        assert archive.read_bytes(readme.name) == TEXT.encode()
+
+
+# Only zip archives honour compression_type and compression_level, tar and 7z accept and ignore them
+@pytest.mark.parametrize("extension", ("tar", "tar.bz2", "tar.gz", "tar.xz", "cbt", "7z", "cb7"))
+def test_write_with_ignored_compression(tmp_path: Path, readme: Path, extension: str) -> None:
+    archive_file = tmp_path / f"archive.{extension}"
+
+    with ArchiveFile(archive_file, "w", compression_level=1, compression_type=CompressionType.BZIP2) as archive:
+        archive.write(readme)
 
     with ArchiveFile(archive_file) as archive:
-        assert archive.read_bytes(file.name) == text
+        assert archive.read_text(readme.name).strip() == TEXT
 
 
 @pytest.mark.parametrize("extension", ("zip", "cbz"))
 @pytest.mark.parametrize("mode", modes)
-def test_write_bytes_with_bzip2_compression(tmp_path: Path, mode: str, extension: str) -> None:
-    archive_file = tmp_path / f"{uuid4()}.{extension}"
-    file = tmp_path / "README.md"
-    file.touch()
-    text = b"Hello World"
-    file.write_bytes(text)
+def test_write_bytes_with_bzip2_compression(tmp_path: Path, readme: Path, mode: str, extension: str) -> None:
+    archive_file = tmp_path / f"archive.{extension}"
 
     with ArchiveFile(
         archive_file, mode=mode, compression_level=0, compression_type=CompressionType.DEFLATED
     ) as archive:
         assert archive.compression_level == 0
-        archive.write(file)
+        archive.write(readme)
 
     with ArchiveFile(archive_file) as archive:
-        assert archive.read_bytes(file.name) == text
+        assert archive.read_bytes(readme.name) == TEXT.encode()
 
 
 @pytest.mark.parametrize("extension", extensions)
 @pytest.mark.parametrize("mode", modes)
-def test_write_str_by_arcname(tmp_path: Path, mode: str, extension: str) -> None:
-    archive_file = tmp_path / f"{uuid4()}.{extension}"
-    file = tmp_path / "README.md"
-    file.touch()
-    text = "Hello World"
-    file.write_text(text)
+def test_write_str_by_arcname(tmp_path: Path, readme: Path, mode: str, extension: str) -> None:
+    archive_file = tmp_path / f"archive.{extension}"
 
     with ArchiveFile(archive_file, mode=mode) as archive:
-        archive.write(file, arcname=file.resolve())
+        archive.write(readme, arcname=readme.resolve())
 
     with ArchiveFile(archive_file) as archive:
-        assert archive.read_text(file.resolve()).strip() == text
+        assert archive.read_text(readme.resolve()).strip() == TEXT
 
 
 @pytest.mark.parametrize("extension", extensions)
 @pytest.mark.parametrize("mode", modes)
-def test_write_zip_bytes_by_arcname(tmp_path: Path, mode: str, extension: str) -> None:
-    archive_file = tmp_path / f"{uuid4()}.{extension}"
-    file = tmp_path / "README.md"
-    file.touch()
-    text = b"Hello World"
-    file.write_bytes(text)
+def test_write_zip_bytes_by_arcname(tmp_path: Path, readme: Path, mode: str, extension: str) -> None:
+    archive_file = tmp_path / f"archive.{extension}"
 
     with ArchiveFile(archive_file, mode=mode) as archive:
-        archive.write(file, arcname=file.resolve())
+        archive.write(readme, arcname=readme.resolve())
 
     with ArchiveFile(archive_file) as archive:
-        assert archive.read_bytes(file.resolve()).strip() == text
+        assert archive.read_bytes(readme.resolve()).strip() == TEXT.encode()
@@ -1,33 +1,17 @@
 from __future__ import annotations
 
 from pathlib import Path
-from uuid import uuid4
 
 import pytest
 from archivefile import ArchiveFile
 
-modes = (
-    "w",
-    "w:",
-    "w:gz",
-    "w:bz2",
-    "w:xz",
-    "x:",
-    "x:",
-    "x:gz",
-    "x:bz2",
-    "x:xz",
-    "a",
-    "a:",
-)
-
-extensions = ("tar", "tar.bz2", "tar.gz", "tar.xz", "cbt") + ("7z", "cb7") + ("zip", "cbz")
+from tests.conftest import extensions, modes
 
 
 @pytest.mark.parametrize("extension", extensions)
 @pytest.mark.parametrize("mode", modes)
 def test_write_text(tmp_path: Path, mode: str, extension: str) -> None:
-    dir = tmp_path / f"{uuid4()}.{extension}"
+    dir = tmp_path / f"archive.{extension}"
     data = "Hello World"
     with ArchiveFile(dir, mode) as archive:
         print(archive)
@@ -40,7 +24,7 @@ def test_write_text(tmp_path: Path, mode: str, extension: str) -> None:
 @pytest.mark.parametrize("extension", extensions)
 @pytest.mark.parametrize("mode", modes)
 def test_write_bytes(tmp_path: Path, mode: str, extension: str) -> None:
-    dir = tmp_path / f"{uuid4()}.{extension}"
+    dir = tmp_path / f"archive.{extension}"
     data = b"Hello World"
     with ArchiveFile(dir, mode) as archive:
         archive.write_bytes(data, arcname=Path("test.dat"))
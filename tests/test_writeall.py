@@ -1,57 +1,106 @@
 from __future__ import annotations
 
 from pathlib import Path
-from uuid import uuid4
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 import pytest
-from archivefile import ArchiveFile
+from archivefile import ArchiveFile, CompressionType
 
-modes = (
-    "w",
-    "w:",
-    "w:gz",
-    "w:bz2",
-    "w:xz",
-    "x:",
-    "x:",
-    "x:gz",
-    "x:bz2",
-    "x:xz",
-    "a",
-    "a:",
-)
+from tests.conftest import extensions, modes
 
-extensions = ("zip", "cbz") + ("tar", "tar.bz2", "tar.gz", "tar.xz", "cbt") + ("7z", "cb7")
 
-
-ARCHIVE_DIR = Path("src/archivefile").resolve()
+# A small package-like tree for writeall() to walk, including a file that the "*.py" glob must skip
+@pytest.fixture(scope="session")
+def source_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    dir = tmp_path_factory.mktemp("source") / "package"
+    (dir / "subpackage").mkdir(parents=True)
+    for name in ("__init__.py", "core.py", "subpackage/__init__.py", "subpackage/utils.py"):
+        (dir / name).write_text(f"# {name}\n")
+    (dir / "py.typed").touch()
+    return dir
 
 
 @pytest.mark.parametrize("extension", extensions)
 @pytest.mark.parametrize("mode", modes)
-def test_writeall(tmp_path: Path, mode: str, extension: str) -> None:
-    dir = tmp_path / f"{uuid4()}.{extension}"
+def test_writeall(tmp_path: Path, source_dir: Path, mode: str, extension: str) -> None:
+    dir = tmp_path / f"archive.{extension}"
     with ArchiveFile(dir, mode) as archive:
-        archive.writeall(ARCHIVE_DIR, glob="*.py")
+        archive.writeall(source_dir, glob="*.py")
 
     with ArchiveFile(dir, "r") as archive:
-        dest = tmp_path / str(uuid4())
+        dest = tmp_path / "dest"
         dest.mkdir(parents=True, exist_ok=True)
         archive.extractall(destination=dest)
 
-    assert len(tuple(ARCHIVE_DIR.rglob("*.py"))) == len(tuple(dest.rglob("*.*")))
+    assert len(tuple(source_dir.rglob("*.py"))) == len(tuple(dest.rglob("*.*")))
 
 
 @pytest.mark.parametrize("extension", extensions)
 @pytest.mark.parametrize("mode", modes)
-def test_writeall_with_root(tmp_path: Path, mode: str, extension: str) -> None:
-    dir = tmp_path / f"{uuid4()}.{extension}"
+def test_writeall_with_root(tmp_path: Path, source_dir: Path, mode: str, extension: str) -> None:
+    dir = tmp_path / f"archive.{extension}"
     with ArchiveFile(dir, mode) as archive:
-        archive.writeall(ARCHIVE_DIR, glob="*.py", root=ARCHIVE_DIR.parent.parent)
+        archive.writeall(source_dir, glob="*.py", root=source_dir.parent.parent)
 
     with ArchiveFile(dir, "r") as archive:
-        dest = tmp_path / str(uuid4())
+        dest = tmp_path / "dest"
         dest.mkdir(parents=True, exist_ok=True)
         archive.extractall(destination=dest)
 
-    assert len(tuple(ARCHIVE_DIR.rglob("*.py"))) == len(tuple(dest.rglob("*.*")))
+    assert len(tuple(source_dir.rglob("*.py"))) == len(tuple(dest.rglob("*.*")))
+
+
+@pytest.mark.parametrize("extension", extensions)
+@pytest.mark.parametrize("mode", modes)
+def test_writeall_skips_directories(tmp_path: Path, mode: str, extension: str) -> None:
+    source = tmp_path / "source"
+    (source / "nested").mkdir(parents=True)
+    (source / "top.txt").write_text("top")
+    (source / "nested" / "inner.txt").write_text("inner")
+
+    dir = tmp_path / f"archive.{extension}"
+    with ArchiveFile(dir, mode) as archive:
+        archive.writeall(source)
+
+    with ArchiveFile(dir, "r") as archive:
+        assert sorted(archive.get_names()) == ["source/nested/inner.txt", "source/top.txt"]
+
+
+def test_writeall_stores_compressed_files(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "image.PNG").write_bytes(b"not really a png")
+    (source / "notes.txt").write_text("plain text")
+
+    with ArchiveFile(tmp_path / "archive.zip", "w", compression_type=CompressionType.DEFLATED) as archive:
+        archive.writeall(source)
+
+    with ZipFile(tmp_path / "archive.zip") as zipfile:
+        assert zipfile.getinfo("source/image.PNG").compress_type == ZIP_STORED
+        assert zipfile.getinfo("source/notes.txt").compress_type == ZIP_DEFLATED
+
+    with ArchiveFile(tmp_path / "compressed.zip", "w", compression_type=CompressionType.DEFLATED) as archive:
+        archive.writeall(source, auto_store=False)
+
+    with ZipFile(tmp_path / "compressed.zip") as zipfile:
+        assert zipfile.getinfo("source/image.PNG").compress_type == ZIP_DEFLATED
+        assert zipfile.getinfo("source/notes.txt").compress_type == ZIP_DEFLATED
+
+
+@pytest.mark.parametrize("extension", ("zip", "tar", "7z"))
+def test_writeall_through_symlinked_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, extension: str) -> None:
+    (tmp_path / "real" / "pkg").mkdir(parents=True)
+    (tmp_path / "real" / "pkg" / "module.py").write_text("spam")
+    link = tmp_path / "link"
+    link.symlink_to(tmp_path / "real")
+    monkeypatch.chdir(link)
+
+    with ArchiveFile(tmp_path / f"absolute.{extension}", "w") as archive:
+        archive.writeall(link / "pkg", root=".")
+
+    with ArchiveFile(tmp_path / f"relative.{extension}", "w") as archive:
+        archive.writeall("pkg", root=link)
+
+    for name in ("absolute", "relative"):
+        with ArchiveFile(tmp_path / f"{name}.{extension}") as archive:
+            assert archive.get_names() == ("pkg/module.py",)